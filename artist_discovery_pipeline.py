@@ -16,31 +16,47 @@ Architecture:
 - Hybrid approach: Spotify for metadata, Perplexity for content
 - Atomic operations: Each artist fully succeeds or fully skips
 - Smart updates: Only enhance cards missing Perplexity data
+- Concurrency: Artists are processed by a worker pool; per-API throttles keep
+  every worker inside the shared rate limits
 - Rate limiting: Respects all API limits
-- Network graph: Maintains artist_connections.json
+- Network graph: Maintains artist_connections.sqlite (export to artist_connections.json
+  with --export-connections)
 
 Usage:
-    python artist_discovery_pipeline.py --archive path/to/wwoz_archive.md [--force] [--dry-run]
+    python artist_discovery_pipeline.py --archive path/to/wwoz_archive.md [--force] [--dry-run] [--workers N]
+                                        [--export-connections]
 """
 
 import os
 import re
 import sys
-import json
 import time
+import queue
+import atexit
+import shutil
+import sqlite3
+import hashlib
+import functools
+import importlib.util
 import logging
+import threading
 import argparse
 import requests
 import base64
+from logging.handlers import QueueHandler, QueueListener
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import Counter, OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Optional, Tuple, Any
 from urllib.parse import quote
 
 import yaml
-from openai import OpenAI
+import orjson
 from tqdm import tqdm
-import musicbrainzngs
+from rapidfuzz import fuzz, process
 
 # Configuration
 SPOTIFY_CLIENT_ID = "a088edf333334899b6ad55579b834389"
@@ -48,55 +64,610 @@ SPOTIFY_CLIENT_SECRET = "78b5d889d9094ff0bb0b2a22cc8cfaac"
 SPOTIFY_TOKEN_URL = "https://accounts.spotify.com/api/token"
 SPOTIFY_SEARCH_URL = "https://api.spotify.com/v1/search"
 SPOTIFY_ARTIST_URL = "https://api.spotify.com/v1/artists"
+SPOTIFY_TOKEN_CACHE_FILE = Path.home() / ".cache" / "wwoz" / "spotify_token.json"
 
 PERPLEXITY_API_BASE = "https://api.perplexity.ai"
 PERPLEXITY_MODEL = "sonar-pro"
 PERPLEXITY_TEMPERATURE = 0.3
 PERPLEXITY_MAX_TOKENS = 4096
+PERPLEXITY_PROMPT_VERSION = 1  # bump when the research prompt changes to invalidate cached research
 
 # Default vault paths
 DEFAULT_CARDS_DIR = "/Users/maxwell/LETSGO/MaxVault/01_Projects/PersonalArtistWiki/Artists"
 DEFAULT_IMAGES_DIR = "/Users/maxwell/LETSGO/MaxVault/03_Resources/source_material/ArtistPortraits"
-CONNECTIONS_FILE = "artist_connections.json"
+CONNECTIONS_FILE = "artist_connections.json"  # JSON export (legacy format, imported on first run)
+CONNECTIONS_DB_FILE = "artist_connections.sqlite"
+CONNECTIONS_CACHE_SIZE = 512  # recently touched connection entries kept in memory
+CONNECTIONS_SAVE_EVERY = 25  # artists upserted between connections DB commits
+API_CACHE_FILE = ".api_cache.sqlite"
+API_CACHE_TTL_DAYS = 30
+API_CACHE_MISS_TTL_DAYS = 7  # "no confident MusicBrainz match" results; MB gains entries over time
+API_CACHE_MBID_TTL_DAYS = 180  # confident name+genres -> MBID matches; re-scored after this
+SPOTIFY_BATCH_SIZE = 50  # max ids per GET /v1/artists request
 
 # Rate limiting
 SPOTIFY_RATE_LIMIT = 0.6  # seconds
 PERPLEXITY_RATE_LIMIT = 2.0  # seconds
 MUSICBRAINZ_RATE_LIMIT = 1.0  # seconds (required: 1 request/second)
+SPOTIFY_MAX_IN_FLIGHT = 5  # concurrent Spotify requests across all workers
+PERPLEXITY_MAX_IN_FLIGHT = 4  # concurrent Perplexity completions across all workers
+SPOTIFY_BURST = 10  # requests allowed back-to-back before the steady rate applies
+PERPLEXITY_BURST = 3
 REQUEST_TIMEOUT = 30
 
+# HTTP connection pooling (keep-alive reuse across Spotify, image CDN, and token hosts)
+HTTP_POOL_CONNECTIONS = 32  # distinct hosts kept in the pool
+HTTP_POOL_MAXSIZE = 64  # connections kept alive per host
+HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504)
+HTTP_RETRY_AFTER_MAX = 30  # seconds; longer server Retry-After requests are clamped so a worker never stalls
+MUSICBRAINZ_RETRY_ATTEMPTS = 4  # tries per MusicBrainz request; retries go back through the 1 req/s limiter
+DEFAULT_WORKERS = 8  # artists processed concurrently (network-bound; enough to keep Perplexity busy)
+PENDING_ARTISTS_PER_WORKER = 2  # artists queued ahead of each worker; the rest are fed in as workers free up
+IMAGE_DOWNLOAD_WORKERS = 4  # background image downloads overlapping API calls
+MUSICBRAINZ_FOLLOWUP_WORKERS = 2  # recording browses overlapping artist lookups
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp')  # in lookup priority order
+IMAGE_COPY_CHUNK_SIZE = 1024 * 1024  # 1 MiB buffer for streaming image downloads to disk
+
 # MusicBrainz Configuration
 MUSICBRAINZ_APP_NAME = "WWOZ-Artist-Discovery-Pipeline"
 MUSICBRAINZ_APP_VERSION = "1.0"
 MUSICBRAINZ_CONTACT = "wwoz-scraper@example.com"
+MUSICBRAINZ_API_BASE = "https://musicbrainz.org/ws/2"
+MUSICBRAINZ_USER_AGENT = f"{MUSICBRAINZ_APP_NAME}/{MUSICBRAINZ_APP_VERSION} ( {MUSICBRAINZ_CONTACT} )"
 MUSICBRAINZ_MIN_CONFIDENCE = 80  # Minimum confidence (0-100) to accept a match
 
+# Existing-card matching
+CARD_FUZZY_MIN_SCORE = 90  # rapidfuzz ratio (0-100) for reporting a card as a possible misspelled duplicate
+COLLABORATOR_FUZZY_MIN_SCORE = 90  # rapidfuzz ratio for treating an MB collaborator as a Perplexity one
+
+
+_WORD_RE = re.compile(r'\w+')
+# Spaces -> underscores, "&" -> "and", filesystem-reserved characters dropped, in one C-level pass
+_FILENAME_TRANSLATION = str.maketrans({' ': '_', '&': 'and', **dict.fromkeys('<>:"/\\|?*')})
+_FILENAME_INVALID_RE = re.compile(r'[^\w\-_.]')
+_TAG_SLUG_TRANSLATION = str.maketrans(' /', '--')
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9]')
+FRONTMATTER_MAX_CHARS = 64 * 1024  # give up on an unterminated frontmatter block after this much
+
+# libyaml's C loader/emitter when PyYAML was built with it (10-20x faster than the pure-Python ones)
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+# Strings that are safe as plain (unquoted) YAML scalars: letter first, no ':'/'#'/flow indicators
+_YAML_PLAIN_RE = re.compile(r"[A-Za-z][A-Za-z0-9 _.,'()/+-]*")
+_YAML_RESERVED_WORDS = frozenset(['yes', 'no', 'true', 'false', 'on', 'off', 'null'])
+_YAML_UNSAFE_CHARS_RE = re.compile('[\x7f-\x9f\u2028\u2029\ufffe\uffff]')  # left raw by JSON, not by YAML
+
+# Recording-relation attributes containing one of these are treated as instruments
+_INSTRUMENT_TOKENS = frozenset([
+    'vocal', 'guitar', 'piano', 'bass', 'drum', 'saxophone', 'trumpet', 'violin', 'keyboard'
+])
+# Archive table row whose 8th column is "✅ Found"; captures the time and artist columns
+_ARCHIVE_ROW_RE = re.compile(
+    r'^[^\S\n]*\|[^\S\n]*([^|\n]*?)[^\S\n]*\|[^\S\n]*([^|\n]*?)[^\S\n]*\|'
+    r'(?:[^|\n]*\|){5}[^\S\n]*✅ Found[^\S\n]*(?:\||$)',
+    re.M
+)
+# Top-level "enhancement_provider: perplexity" line, checked before paying for a YAML parse
+_PERPLEXITY_MARKER_RE = re.compile(r'^enhancement_provider:[ \t]*[\'"]?perplexity[\'"]?[ \t]*\r?$', re.M)
+_PERPLEXITY_MARKER_BYTES_RE = re.compile(_PERPLEXITY_MARKER_RE.pattern.encode('utf-8'), re.M)
+# Frontmatter fields stamped with the build time; ignored when deciding if a rewrite changes anything
+_CARD_TIMESTAMP_RE = re.compile(rb'^(?:biography_enhanced_at|entry_created|last_updated):.*$', re.M)
+_LUCENE_SPECIAL_RE = re.compile(r'([+\-&|!(){}\[\]\^"~*?:\\/])')
+
+
+def _normalize_name(name: str) -> str:
+    """Case-fold and trim an artist name for comparisons."""
+    return name.casefold().strip()
+
+
+def _simple_connections(connections: Dict[str, Any]) -> Dict[str, List[str]]:
+    """Reduce Perplexity connections to unique names per type, keeping first-seen order."""
+    return {
+        conn_type: list(dict.fromkeys(
+            conn['name'] for conn in connections[conn_type]
+            if isinstance(conn, dict) and conn.get('name')
+        ))
+        for conn_type in ('mentors', 'collaborators', 'influenced')
+        if conn_type in connections
+    }
+
+
+def _genre_keywords(genres: Optional[List[str]]) -> frozenset:
+    """
+    Split genre strings into keywords (e.g., "east coast hip hop" -> east, coast, hip, hop).
+
+    Uses the same word tokenizer as _disambiguation_tokens, so "r&b" and "afro-cuban"
+    split into the same parts on both sides of the intersection.
+    """
+    return frozenset(keyword for genre in genres or () for keyword in _WORD_RE.findall(genre.casefold()))
+
+
+_COLLABORATOR_STRIP_TABLE = str.maketrans('', '', '.,')
+
+
+def _normalize_collaborator(name: str) -> str:
+    """Comparison key for collaborator names ("Dr. John," and "dr john" collide)."""
+    return name.lower().strip().translate(_COLLABORATOR_STRIP_TABLE)
+
+
+def _disambiguation_tokens(artist: Dict[str, Any]) -> frozenset:
+    """Word tokens of a MusicBrainz candidate's disambiguation text."""
+    return frozenset(_WORD_RE.findall(artist.get('disambiguation', '').casefold()))
+
+
+@functools.lru_cache(maxsize=512)
+def _tag_slug(tag: str) -> str:
+    """Render a MusicBrainz tag as an Obsidian hashtag (cached: the same genres recur across cards)."""
+    return '#' + tag.translate(_TAG_SLUG_TRANSLATION)
+
+
+@functools.lru_cache(maxsize=8192)
+def _sanitize_filename(name: str) -> str:
+    """
+    Sanitize artist name for use as filename with normalization.
+
+    Converts to lowercase first to prevent duplicates like:
+    - "DR. JOHN" -> "dr_john.md"
+    - "Dr. John" -> "dr_john.md"
+    - "dr john" -> "dr_john.md"
+
+    Cached because the same names recur across a batch (card filenames, member and
+    collaborator wikilinks).
+    """
+    # Normalize to lowercase first to prevent case-based duplicates, then replace
+    # spaces/ampersands and remove reserved characters
+    sanitized = name.lower().translate(_FILENAME_TRANSLATION)
+
+    # Remove any other special characters (unicode letters such as "é" are kept)
+    sanitized = _FILENAME_INVALID_RE.sub('', sanitized)
+
+    # Trim length if needed
+    if len(sanitized) > 200:
+        sanitized = sanitized[:200]
+
+    return sanitized.strip('.')
+
+
+def _read_frontmatter(f) -> Tuple[bool, Optional[str]]:
+    """
+    Read a card's YAML frontmatter line by line, stopping at the closing delimiter.
+
+    Returns (has_opening_delimiter, frontmatter_text); the text is None when the block is
+    missing or never closed. The file is left positioned just after the closing `---` line,
+    so the body is only read by callers that need it.
+    """
+    first_line = f.readline()
+    if not first_line.startswith('---'):
+        return False, None
+
+    lines = [first_line[3:]]
+    size = 0
+    for line in f:
+        if line.startswith('---'):
+            return True, ''.join(lines)
+        lines.append(line)
+        size += len(line)
+        if size > FRONTMATTER_MAX_CHARS:
+            break
+    return True, None
+
+
+def _yaml_scalar(value: Any) -> str:
+    """Render a scalar for the frontmatter emitter; TypeError for anything it doesn't handle."""
+    if value is None:
+        return 'null'
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, str):
+        if (_YAML_PLAIN_RE.fullmatch(value) and not value.endswith(' ')
+                and value.lower() not in _YAML_RESERVED_WORDS):
+            return value
+        # A JSON string is a valid YAML double-quoted scalar once the characters YAML reads as
+        # line breaks (NEL, U+2028/9) or rejects as non-printable are escaped as well
+        return _YAML_UNSAFE_CHARS_RE.sub(lambda m: f"\\u{ord(m.group()):04x}",
+                                         orjson.dumps(value).decode('utf-8'))
+    raise TypeError(f"unsupported frontmatter value: {type(value).__name__}")
+
+
+def _yaml_block(value: Any, indent: int, out: List[str]) -> None:
+    """Append block-style YAML lines for a mapping or sequence (keys sorted, as yaml.dump does)."""
+    pad = ' ' * indent
+    if isinstance(value, dict):
+        for key in sorted(value):
+            item = value[key]
+            if not isinstance(key, str):
+                raise TypeError(f"unsupported frontmatter key: {key!r}")
+            if isinstance(item, (dict, list)) and item:
+                out.append(f"{pad}{_yaml_scalar(key)}:\n")
+                _yaml_block(item, indent + 2 if isinstance(item, dict) else indent, out)
+            elif isinstance(item, (dict, list)):
+                out.append(f"{pad}{_yaml_scalar(key)}: {'{}' if isinstance(item, dict) else '[]'}\n")
+            else:
+                out.append(f"{pad}{_yaml_scalar(key)}: {_yaml_scalar(item)}\n")
+    else:
+        for item in value:
+            if isinstance(item, dict) and item:
+                # First key shares the "- " line; the rest align under it
+                start = len(out)
+                _yaml_block(item, indent + 2, out)
+                out[start] = f"{pad}- {out[start][indent + 2:]}"
+            elif isinstance(item, (dict, list)):
+                if item:
+                    raise TypeError("nested sequences are not supported")
+                out.append(f"{pad}- {'{}' if isinstance(item, dict) else '[]'}\n")
+            else:
+                out.append(f"{pad}- {_yaml_scalar(item)}\n")
+
+
+def _dump_frontmatter(frontmatter: Dict[str, Any]) -> str:
+    """
+    Emit card frontmatter as block YAML by hand.
+
+    Cards hold shallow mappings of strings, ints, bools and lists, so plain string building
+    skips PyYAML's representer pass; anything outside that shape falls back to yaml.dump.
+    """
+    out: List[str] = []
+    try:
+        _yaml_block(frontmatter, 0, out)
+    except TypeError:
+        return yaml.dump(frontmatter, Dumper=_YAML_DUMPER, default_flow_style=False, allow_unicode=True)
+    return ''.join(out)
+
+
+class _CappedRetry(Retry):
+    """urllib3 Retry that honors Retry-After, but never sleeps longer than HTTP_RETRY_AFTER_MAX."""
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, HTTP_RETRY_AFTER_MAX)
+
+
+def _open_database(path: Path, schema: str, read_only: bool = False) -> sqlite3.Connection:
+    """
+    Open a SQLite database shared across worker threads and make sure `schema` exists.
+
+    With `read_only=True` (dry runs) no file is ever created or modified: an existing database
+    is opened immutable (so not even -wal/-shm files appear), and an empty in-memory database
+    stands in when there is none yet.
+    """
+    if not read_only:
+        conn = sqlite3.connect(str(path), check_same_thread=False)
+        conn.execute(schema)
+        conn.commit()
+        return conn
+
+    if path.exists():
+        conn = sqlite3.connect(f"{path.as_uri()}?mode=ro&immutable=1", uri=True, check_same_thread=False)
+        try:
+            conn.execute(schema)  # no-op when the table exists; fails on an older, table-less file
+            return conn
+        except sqlite3.Error:
+            conn.close()
+
+    conn = sqlite3.connect(':memory:', check_same_thread=False)
+    conn.execute(schema)
+    return conn
+
+
+class RateLimiter:
+    """
+    Thread-safe token-bucket throttle shared by every worker calling one API.
+
+    Sustains one request per `interval` seconds but lets up to `burst` requests through
+    back-to-back after an idle spell, so callers only wait when the bucket is empty
+    (burst=1 is a strict minimum interval, as MusicBrainz requires).
+
+    Used as a context manager it also caps the requests in flight at `max_in_flight`
+    (held for the duration of the call), so slow responses cannot pile up workers on one host.
+    """
+
+    def __init__(self, interval: float, max_in_flight: Optional[int] = None, burst: int = 1):
+        self.interval = interval
+        self._burst_allowance = (burst - 1) * interval
+        self._lock = threading.Lock()
+        self._next_due = 0.0  # when the next request would go out at the steady rate
+        self._in_flight = threading.BoundedSemaphore(max_in_flight) if max_in_flight else None
+
+    def wait(self) -> None:
+        """Block until a token is available for the caller's request."""
+        with self._lock:
+            now = time.monotonic()
+            due = max(now, self._next_due)
+            slot = max(now, due - self._burst_allowance)
+            self._next_due = due + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+    def __enter__(self) -> 'RateLimiter':
+        if self._in_flight is not None:
+            self._in_flight.acquire()
+        self.wait()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self._in_flight is not None:
+            self._in_flight.release()
+
+
+class ApiCache:
+    """
+    Persistent SQLite cache of API responses shared across pipeline runs.
+
+    Entries are keyed by a SHA-1 of the namespace plus the normalized lookup parts
+    (e.g. "spotify" + artist name) and expire after `ttl_seconds`. An in-process
+    dict fronts the database so repeat lookups within a run skip SQLite entirely.
+    With `read_enabled=False` cached values are ignored but fresh results are still stored.
+    With `read_only=True` (dry runs) fresh results are only kept in memory for the run.
+    """
+
+    def __init__(self, path: Path, ttl_seconds: float, read_enabled: bool = True, read_only: bool = False):
+        self.ttl_seconds = ttl_seconds
+        self.read_enabled = read_enabled
+        self.read_only = read_only
+        self._memory: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._conn = _open_database(
+            path,
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, stored_at REAL NOT NULL, payload TEXT NOT NULL)",
+            read_only=read_only
+        )
+
+    @staticmethod
+    def _key(namespace: str, *parts: str) -> str:
+        normalized = '|'.join(part.lower().strip() for part in parts)
+        return hashlib.sha1(f"{namespace}:{normalized}".encode('utf-8')).hexdigest()
+
+    def get(self, namespace: str, *parts: str, max_age: Optional[float] = None) -> Optional[Any]:
+        """
+        Return the cached value, or None when missing, expired, or reads are disabled.
+
+        `max_age` overrides the default TTL (seconds) for long-lived entries such as ids.
+        """
+        if not self.read_enabled:
+            return None
+
+        key = self._key(namespace, *parts)
+        with self._lock:
+            if key in self._memory:
+                return self._memory[key]
+
+            row = self._conn.execute(
+                "SELECT stored_at, payload FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            ttl = self.ttl_seconds if max_age is None else max_age
+            if not row or time.time() - row[0] > ttl:
+                return None
+
+            value = orjson.loads(row[1])
+            self._memory[key] = value
+            return value
+
+    def set(self, namespace: str, *parts: str, value: Any) -> None:
+        """Store a value for the given lookup."""
+        key = self._key(namespace, *parts)
+        payload = orjson.dumps(value).decode('utf-8')
+        with self._lock:
+            self._memory[key] = value
+            if self.read_only:
+                return
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, stored_at, payload) VALUES (?, ?, ?)",
+                (key, time.time(), payload)
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class ConnectionsStore:
+    """
+    SQLite-backed artist connections network (artist -> mentors/collaborators/influenced).
+
+    Each update is an upsert of a single row, so saving no longer rewrites the whole
+    network. Upserts are committed in batches of `save_every` artists (and on flush/close).
+    The database runs in WAL mode and a small LRU of recently touched entries fronts it.
+    With `read_only=True` (dry runs) updates stay in memory only and no database file is created.
+    """
+
+    def __init__(self, path: Path, cache_size: int = CONNECTIONS_CACHE_SIZE, read_only: bool = False,
+                 save_every: int = CONNECTIONS_SAVE_EVERY):
+        self.read_only = read_only
+        self.cache_size = cache_size
+        self.save_every = max(1, save_every)
+        self._cache: OrderedDict = OrderedDict()
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._dirty: set = set()
+        self._lock = threading.Lock()
+        self._conn = _open_database(
+            path,
+            "CREATE TABLE IF NOT EXISTS connections (artist TEXT PRIMARY KEY, data JSON NOT NULL)",
+            read_only=read_only
+        )
+        if not read_only:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+
+    def _remember(self, artist: str, data: Dict[str, Any]) -> None:
+        self._cache[artist] = data
+        self._cache.move_to_end(artist)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def get(self, artist: str) -> Optional[Dict[str, Any]]:
+        """Return the stored connections for an artist, or None."""
+        with self._lock:
+            if artist in self._pending:
+                return self._pending[artist]
+            if artist in self._cache:
+                self._cache.move_to_end(artist)
+                return self._cache[artist]
+
+            row = self._conn.execute(
+                "SELECT data FROM connections WHERE artist = ?", (artist,)
+            ).fetchone()
+            if not row:
+                return None
+
+            data = orjson.loads(row[0])
+            self._remember(artist, data)
+            return data
+
+    def upsert(self, artist: str, data: Dict[str, Any]) -> None:
+        """Insert or replace an artist's connections."""
+        with self._lock:
+            if self.read_only:
+                self._pending[artist] = data
+                return
+            self._conn.execute(
+                "INSERT INTO connections (artist, data) VALUES (?, json(?)) "
+                "ON CONFLICT(artist) DO UPDATE SET data = excluded.data",
+                (artist, orjson.dumps(data).decode('utf-8'))
+            )
+            self._remember(artist, data)
+            self._dirty.add(artist)
+            if len(self._dirty) >= self.save_every:
+                self._commit()
+
+    def _commit(self) -> None:
+        self._conn.commit()
+        self._dirty.clear()
+
+    def flush(self) -> None:
+        """Commit any upserts still waiting for the next batch."""
+        with self._lock:
+            if self._dirty:
+                self._commit()
+
+    def import_json(self, json_path: Path) -> int:
+        """Load a legacy artist_connections.json export into the database; returns entries imported."""
+        with open(json_path, 'rb') as f:
+            legacy = orjson.loads(f.read())
+
+        with self._lock:
+            if self.read_only:
+                self._pending.update(legacy)
+            else:
+                self._conn.executemany(
+                    "INSERT INTO connections (artist, data) VALUES (?, json(?)) "
+                    "ON CONFLICT(artist) DO UPDATE SET data = excluded.data",
+                    [(artist, orjson.dumps(data).decode('utf-8')) for artist, data in legacy.items()]
+                )
+                self._conn.commit()
+        return len(legacy)
+
+    def export_json(self, json_path: Path) -> int:
+        """Write the whole network in the legacy JSON format; returns the number of artists."""
+        with self._lock:
+            network = {
+                artist: orjson.loads(data)
+                for artist, data in self._conn.execute("SELECT artist, data FROM connections ORDER BY rowid")
+            }
+            network.update(self._pending)
+
+        # Write beside the target and swap it in, so a crash never leaves a truncated export
+        tmp_path = json_path.with_suffix('.json.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps(network, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        os.replace(tmp_path, json_path)
+        return len(network)
+
+    def __len__(self) -> int:
+        with self._lock:
+            count = self._conn.execute("SELECT COUNT(*) FROM connections").fetchone()[0]
+            if self._pending:
+                stored = {
+                    artist for artist in self._pending
+                    if self._conn.execute(
+                        "SELECT 1 FROM connections WHERE artist = ?", (artist,)
+                    ).fetchone()
+                }
+                count += len(self._pending) - len(stored)
+            return count
+
+    def close(self) -> None:
+        with self._lock:
+            if self._dirty:
+                self._commit()
+            self._conn.close()
+
 
 class ArtistDiscoveryPipeline:
     """Main pipeline for discovering and processing new artists from WWOZ archives."""
 
-    def __init__(self, cards_dir: str, images_dir: str, dry_run: bool = False, force: bool = False):
+    def __init__(self, cards_dir: str, images_dir: str, dry_run: bool = False, force: bool = False,
+                 workers: int = DEFAULT_WORKERS, use_cache: bool = True,
+                 save_every: int = CONNECTIONS_SAVE_EVERY):
         self.cards_dir = Path(cards_dir)
         self.images_dir = Path(images_dir)
         self.dry_run = dry_run
         self.force = force
+        self.workers = max(1, workers)
 
         # Create directories if they don't exist
         self.cards_dir.mkdir(parents=True, exist_ok=True)
         self.images_dir.mkdir(parents=True, exist_ok=True)
 
+        # One directory scan each instead of stat() probes per artist;
+        # card stem -> size in bytes serves both existence and enhancement checks
+        self._card_sizes, self._existing_images = self._scan_existing_files()
+
+        # Normalized name -> card path, for case/punctuation variant lookups
+        self._card_index: Dict[str, Path] = {}
+        # The index keys bucketed by length, kept in step so fuzzy lookups only score keys
+        # whose length could possibly reach CARD_FUZZY_MIN_SCORE
+        self._card_keys_by_length: Dict[int, List[str]] = {}
+        for stem in sorted(self._card_sizes):
+            self._index_card(stem)
+
         # Initialize components
-        self.session = requests.Session()
+        self.session = self._create_session()
         self.spotify_token = None
         self.spotify_token_expires_at = 0
         self.perplexity_client = None
+        self._spotify_auth_lock = threading.Lock()
+
+        # Per-API throttles (shared across worker threads)
+        self.spotify_limiter = RateLimiter(SPOTIFY_RATE_LIMIT, SPOTIFY_MAX_IN_FLIGHT, SPOTIFY_BURST)
+        self.musicbrainz_limiter = RateLimiter(MUSICBRAINZ_RATE_LIMIT)
+        self.perplexity_limiter = RateLimiter(PERPLEXITY_RATE_LIMIT, PERPLEXITY_MAX_IN_FLIGHT, PERPLEXITY_BURST)
+
+        # Image downloads run in the background while MusicBrainz/Perplexity calls proceed
+        self._image_executor = ThreadPoolExecutor(max_workers=IMAGE_DOWNLOAD_WORKERS,
+                                                  thread_name_prefix='image-download')
+        # Image URL -> file downloaded this run; name variants resolving to the same Spotify
+        # artist share one portrait, which is linked instead of fetched again
+        self._downloaded_images: Dict[str, Path] = {}
+
+        # A single MusicBrainz worker serializes MB work (1 req/s) while artist workers
+        # continue with Perplexity research
+        self._musicbrainz_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='musicbrainz')
+
+        # MusicBrainz recording browses overlap the artist lookup for the same MBID
+        self._musicbrainz_followup_executor = ThreadPoolExecutor(max_workers=MUSICBRAINZ_FOLLOWUP_WORKERS,
+                                                                 thread_name_prefix='musicbrainz-followup')
+
+        # Persistent Spotify/MusicBrainz/Perplexity response cache (--no-cache forces a refresh;
+        # dry runs read it but never write to the vault)
+        self.api_cache = ApiCache(
+            self.cards_dir / API_CACHE_FILE,
+            ttl_seconds=API_CACHE_TTL_DAYS * 86400,
+            read_enabled=use_cache,
+            read_only=self.dry_run
+        )
 
-        # Initialize MusicBrainz
-        musicbrainzngs.set_useragent(MUSICBRAINZ_APP_NAME, MUSICBRAINZ_APP_VERSION, MUSICBRAINZ_CONTACT)
-
-        # Load connections database
+        # Connections database (SQLite; artist_connections.json is kept as an export format)
         self.connections_file = self.cards_dir / CONNECTIONS_FILE
-        self.connections_db = self._load_connections()
+        self.connections_db = ConnectionsStore(
+            self.cards_dir / CONNECTIONS_DB_FILE,
+            read_only=self.dry_run,
+            save_every=save_every
+        )
 
         # Statistics
         self.stats = {
@@ -105,49 +676,149 @@ class ArtistDiscoveryPipeline:
             'skipped_existing': 0,
             'skipped_perplexity': 0,  # Skipped due to already having Perplexity enhancement
             'skipped_duplicate': 0,  # Skipped due to finding case variant
+            'possible_duplicates': 0,  # Processed despite a near-identical card name (reported only)
             'enhanced': 0,
             'created': 0,
             'errors': 0,
             'connections_found': 0
         }
+        self._stats_lock = threading.Lock()
 
         # Setup logging
         self.setup_logging()
 
+        # One-time import of a pre-SQLite artist_connections.json
+        self._migrate_connections()
+
     def setup_logging(self):
-        """Configure logging for the pipeline."""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
+        """
+        Configure logging for the pipeline.
+
+        Worker threads only enqueue records; a QueueListener thread formats them and does the
+        stdout/file writes, so handler I/O and its lock never stall an artist worker.
+        """
+        if not logging.getLogger().handlers:
+            formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+            handlers = [
                 logging.StreamHandler(sys.stdout),
                 logging.FileHandler('artist_discovery_pipeline.log')
             ]
-        )
+            for handler in handlers:
+                handler.setFormatter(formatter)
+
+            log_queue = queue.Queue(-1)
+            listener = QueueListener(log_queue, *handlers)
+            listener.start()
+            # Drains and flushes queued records on exit
+            atexit.register(listener.stop)
+
+            # Records are only merged with their args here; timestamps/levels are formatted by the listener
+            queue_handler = QueueHandler(log_queue)
+            queue_handler.setFormatter(logging.Formatter('%(message)s'))
+            logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
+
         self.logger = logging.getLogger(__name__)
 
-        # Suppress musicbrainzngs verbose logging (uncaught attribute messages)
-        logging.getLogger('musicbrainzngs').setLevel(logging.WARNING)
+    def _create_session(self) -> requests.Session:
+        """Create an HTTP session with a pooled keep-alive adapter and transient-error retries."""
+        session = requests.Session()
+        retry = _CappedRetry(
+            total=5,
+            backoff_factor=1.0,  # capped exponential backoff between attempts
+            status_forcelist=HTTP_RETRY_STATUSES,
+            allowed_methods=frozenset({"GET", "POST"}),
+            respect_retry_after_header=True,  # clamped to HTTP_RETRY_AFTER_MAX
+            raise_on_status=False  # Hand the final response back so callers can log its status
+        )
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_CONNECTIONS,
+            pool_maxsize=HTTP_POOL_MAXSIZE,
+            max_retries=retry
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        # MusicBrainz answers over-rate requests with 503; status retries from the adapter would
+        # bypass musicbrainz_limiter, so _musicbrainz_get retries those itself (connection errors
+        # never reached the server and are still retried here)
+        musicbrainz_adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=HTTP_POOL_MAXSIZE,
+            max_retries=retry.new(status_forcelist=None, respect_retry_after_header=False)
+        )
+        session.mount(MUSICBRAINZ_API_BASE, musicbrainz_adapter)
+        return session
+
+    def _scan_existing_files(self) -> Tuple[Dict[str, int], Dict[str, str]]:
+        """
+        List the cards and images directories once.
 
-    def _load_connections(self) -> Dict[str, Any]:
-        """Load existing connections database or create new one."""
-        if self.connections_file.exists():
+        Returns ({card stem: size}, {image stem: extension}); when an image exists under several
+        extensions the first one in IMAGE_EXTENSIONS wins, matching the old probe order.
+        """
+        with os.scandir(self.cards_dir) as entries:
+            card_sizes = {
+                entry.name[:-3]: entry.stat().st_size for entry in entries
+                if entry.name.endswith('.md') and entry.is_file()
+            }
+
+        existing_images: Dict[str, str] = {}
+        with os.scandir(self.images_dir) as entries:
+            for entry in entries:
+                stem, ext = os.path.splitext(entry.name)
+                if ext not in IMAGE_EXTENSIONS or not entry.is_file():
+                    continue
+                current = existing_images.get(stem)
+                if current is None or IMAGE_EXTENSIONS.index(ext) < IMAGE_EXTENSIONS.index(current):
+                    existing_images[stem] = ext
+
+        return card_sizes, existing_images
+
+    def _index_card(self, stem: str) -> None:
+        """Record a card in the normalized-name index (the first card for a key wins)."""
+        key = _NON_ALNUM_RE.sub('', stem.lower())
+        if key not in self._card_index:
+            self._card_index[key] = self.cards_dir / f"{stem}.md"
+            self._card_keys_by_length.setdefault(len(key), []).append(key)
+
+    def _fuzzy_card_candidates(self, key: str) -> List[str]:
+        """
+        Index keys long/short enough to reach CARD_FUZZY_MIN_SCORE against `key`.
+
+        fuzz.ratio is at most 200 * min(len) / (len_a + len_b), so a score of c needs the other
+        length within [len * c / (200 - c), len * (200 - c) / c]; everything else is skipped.
+        """
+        cutoff = CARD_FUZZY_MIN_SCORE
+        shortest = -(-len(key) * cutoff // (200 - cutoff))
+        longest = len(key) * (200 - cutoff) // cutoff
+        candidates: List[str] = []
+        for length in range(shortest, longest + 1):
+            candidates.extend(self._card_keys_by_length.get(length, ()))
+        return candidates
+
+    def _increment_stat(self, key: str, amount: int = 1) -> int:
+        """Increment a statistics counter from any worker thread and return the new value."""
+        with self._stats_lock:
+            self.stats[key] += amount
+            return self.stats[key]
+
+    def _migrate_connections(self) -> None:
+        """Import the legacy JSON connections file the first time the SQLite database is used."""
+        if len(self.connections_db) == 0 and self.connections_file.exists():
             try:
-                with open(self.connections_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                count = self.connections_db.import_json(self.connections_file)
+                self.logger.info(f"Imported {count} artists from {self.connections_file.name}")
             except Exception as e:
                 self.logger.warning(f"Could not load connections file: {e}")
-        return {}
 
-    def _save_connections(self) -> None:
-        """Save connections database to file."""
+    def export_connections(self) -> None:
+        """Export the connections database to artist_connections.json."""
         if not self.dry_run:
             try:
-                with open(self.connections_file, 'w', encoding='utf-8') as f:
-                    json.dump(self.connections_db, f, indent=2, ensure_ascii=False)
-                self.logger.info(f"Saved connections database with {len(self.connections_db)} artists")
+                count = self.connections_db.export_json(self.connections_file)
+                self.logger.info(f"Exported connections database with {count} artists")
             except Exception as e:
-                self.logger.error(f"Error saving connections: {e}")
+                self.logger.error(f"Error exporting connections: {e}")
 
     # === SPOTIFY API METHODS ===
 
@@ -176,6 +847,7 @@ class ArtistDiscoveryPipeline:
                 self.spotify_token = token_data["access_token"]
                 expires_in = token_data.get("expires_in", 3600)
                 self.spotify_token_expires_at = time.time() + expires_in - 60
+                self._save_cached_spotify_token(time.time() + expires_in)
 
                 self.logger.info("Successfully authenticated with Spotify API")
                 return True
@@ -187,32 +859,90 @@ class ArtistDiscoveryPipeline:
             self.logger.error(f"Exception during Spotify authentication: {e}")
             return False
 
+    def _load_cached_spotify_token(self) -> bool:
+        """Adopt a still-valid token saved by an earlier run (skips the auth round-trip)."""
+        try:
+            with open(SPOTIFY_TOKEN_CACHE_FILE, 'rb') as f:
+                cached = orjson.loads(f.read())
+            if time.time() < cached['expires_at'] - 60:
+                self.spotify_token = cached['token']
+                self.spotify_token_expires_at = cached['expires_at'] - 60
+                self.logger.info("Using cached Spotify access token")
+                return True
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.logger.warning(f"Could not read cached Spotify token: {e}")
+        return False
+
+    def _save_cached_spotify_token(self, expires_at: float) -> None:
+        """Persist the current token for later runs (owner-only permissions)."""
+        try:
+            SPOTIFY_TOKEN_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(SPOTIFY_TOKEN_CACHE_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(orjson.dumps({'token': self.spotify_token, 'expires_at': expires_at}))
+        except Exception as e:
+            self.logger.warning(f"Could not cache Spotify token: {e}")
+
     def ensure_spotify_authenticated(self) -> bool:
         """Ensure we have a valid Spotify access token."""
-        if not self.spotify_token or time.time() >= self.spotify_token_expires_at:
-            return self.authenticate_spotify()
-        return True
+        with self._spotify_auth_lock:
+            if not self.spotify_token or time.time() >= self.spotify_token_expires_at:
+                return self._load_cached_spotify_token() or self.authenticate_spotify()
+            return True
 
-    def get_spotify_metadata(self, artist_name: str) -> Optional[Dict[str, Any]]:
+    def _spotify_get(self, url: str) -> Optional[requests.Response]:
         """
-        Get comprehensive Spotify metadata for an artist.
+        GET a Spotify Web API URL with the current bearer token.
 
-        Returns dict with: artist_id, name, genres, popularity, followers, spotify_url, image_url
+        Rate-limit (429) and server errors are retried by the session adapter; a 401
+        invalidates the token and the request is retried once with a fresh one.
         """
-        if not self.ensure_spotify_authenticated():
-            return None
+        response = None
+        for attempt in range(2):
+            if not self.ensure_spotify_authenticated():
+                return None
 
-        try:
+            token = self.spotify_token
             headers = {
-                "Authorization": f"Bearer {self.spotify_token}",
+                "Authorization": f"Bearer {token}",
                 "Content-Type": "application/json"
             }
 
-            # Search for artist
+            with self.spotify_limiter:
+                response = self.session.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+            if response.status_code != 401 or attempt:
+                return response
+
+            self.logger.warning("Spotify token expired, re-authenticating...")
+            with self._spotify_auth_lock:
+                # Another worker may already have refreshed it
+                if self.spotify_token == token:
+                    self.spotify_token = None
+                    SPOTIFY_TOKEN_CACHE_FILE.unlink(missing_ok=True)
+
+        return response
+
+    def get_spotify_metadata(self, artist_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get comprehensive Spotify metadata for an artist.
+
+        Returns dict with: artist_id, name, genres, popularity, followers, spotify_url, image_url
+        """
+        cached = self.api_cache.get('spotify', artist_name)
+        if cached is not None:
+            self.logger.info(f"Using cached Spotify metadata for: {artist_name}")
+            return cached
+
+        try:
+            # Search for artist (only the top hit is used, so don't pay for nine more artist objects)
             query = quote(artist_name)
-            url = f"{SPOTIFY_SEARCH_URL}?q={query}&type=artist&limit=10"
+            url = f"{SPOTIFY_SEARCH_URL}?q={query}&type=artist&limit=1"
 
-            response = self.session.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+            response = self._spotify_get(url)
+            if response is None:
+                return None
 
             if response.status_code == 200:
                 data = response.json()
@@ -220,34 +950,17 @@ class ArtistDiscoveryPipeline:
 
                 if artists:
                     artist = artists[0]
-
-                    # Get image URL
-                    image_url = None
-                    if artist.get('images'):
-                        image_url = artist['images'][0]['url']
-
-                    metadata = {
-                        'artist_id': artist['id'],
-                        'name': artist['name'],
-                        'genres': artist.get('genres', []),
-                        'popularity': artist.get('popularity', 0),
-                        'followers': artist.get('followers', {}).get('total', 0),
-                        'spotify_url': artist.get('external_urls', {}).get('spotify', ''),
-                        'image_url': image_url
-                    }
+                    metadata = self._build_spotify_metadata(artist)
 
                     self.logger.info(f"Found Spotify artist: {artist['name']} (ID: {artist['id']})")
+                    self.api_cache.set('spotify', artist_name, value=metadata)
+                    # Remember the id so later runs can refresh via the batched /artists endpoint
+                    self.api_cache.set('spotify_id', artist_name, value=artist['id'])
                     return metadata
                 else:
                     self.logger.warning(f"No Spotify artist found for: {artist_name}")
                     return None
 
-            elif response.status_code == 401:
-                self.logger.warning("Spotify token expired, re-authenticating...")
-                if self.authenticate_spotify():
-                    return self.get_spotify_metadata(artist_name)
-                return None
-
             else:
                 self.logger.error(f"Spotify API error for {artist_name}: {response.status_code}")
                 return None
@@ -256,6 +969,71 @@ class ArtistDiscoveryPipeline:
             self.logger.error(f"Error getting Spotify metadata for {artist_name}: {e}")
             return None
 
+    def _build_spotify_metadata(self, artist: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract the pipeline's metadata fields from a Spotify artist object."""
+        # Get image URL
+        image_url = None
+        if artist.get('images'):
+            image_url = artist['images'][0]['url']
+
+        return {
+            'artist_id': artist['id'],
+            'name': artist['name'],
+            'genres': artist.get('genres', []),
+            'popularity': artist.get('popularity', 0),
+            'followers': artist.get('followers', {}).get('total', 0),
+            'spotify_url': artist.get('external_urls', {}).get('spotify', ''),
+            'image_url': image_url
+        }
+
+    def prefetch_spotify_metadata(self, artist_names: List[str]) -> int:
+        """
+        Refresh Spotify metadata in bulk for artists whose Spotify id is already known.
+
+        Names with a remembered id but no fresh metadata are fetched SPOTIFY_BATCH_SIZE at a
+        time via GET /v1/artists?ids=..., and the results are stored in the API cache so
+        get_spotify_metadata serves them without a per-artist /search. Unknown names are
+        left for the regular search path.
+
+        Returns: Number of artists prefetched
+        """
+        known_ids = {}
+        for name in artist_names:
+            if self.api_cache.get('spotify', name) is not None:
+                continue
+            artist_id = self.api_cache.get('spotify_id', name, max_age=float('inf'))
+            if artist_id:
+                known_ids.setdefault(artist_id, []).append(name)
+
+        if not known_ids:
+            return 0
+
+        prefetched = 0
+        ids = list(known_ids)
+        for start in range(0, len(ids), SPOTIFY_BATCH_SIZE):
+            batch = ids[start:start + SPOTIFY_BATCH_SIZE]
+            try:
+                response = self._spotify_get(f"{SPOTIFY_ARTIST_URL}?ids={','.join(batch)}")
+                if response is None or response.status_code != 200:
+                    status = response.status_code if response is not None else 'no response'
+                    self.logger.warning(f"Spotify batch lookup failed ({status}); falling back to search")
+                    continue
+
+                for artist in response.json().get('artists', []):
+                    if not artist:
+                        continue
+                    metadata = self._build_spotify_metadata(artist)
+                    for name in known_ids.get(artist['id'], []):
+                        self.api_cache.set('spotify', name, value=metadata)
+                        prefetched += 1
+
+            except Exception as e:
+                self.logger.error(f"Error in Spotify batch lookup: {e}")
+
+        self.logger.info(f"Prefetched Spotify metadata for {prefetched} artists "
+                         f"in {-(-len(ids) // SPOTIFY_BATCH_SIZE)} batch requests")
+        return prefetched
+
     def download_artist_image(self, image_url: str, artist_name: str) -> Optional[str]:
         """
         Download artist image and return relative path for Obsidian.
@@ -266,16 +1044,27 @@ class ArtistDiscoveryPipeline:
             sanitized_name = self.sanitize_filename(artist_name)
 
             # Check if image already exists
-            for ext in ['.jpg', '.jpeg', '.png', '.webp']:
-                image_path = self.images_dir / f"{sanitized_name}{ext}"
-                if image_path.exists():
-                    self.logger.info(f"Image already exists: {image_path}")
-                    return f"03_Resources/source_material/ArtistPortraits/{sanitized_name}{ext}"
+            ext = self._existing_images.get(sanitized_name)
+            if ext:
+                self.logger.info(f"Image already exists: {self.images_dir / f'{sanitized_name}{ext}'}")
+                return f"03_Resources/source_material/ArtistPortraits/{sanitized_name}{ext}"
 
             if self.dry_run:
                 self.logger.info(f"[DRY RUN] Would download image for: {artist_name}")
                 return f"03_Resources/source_material/ArtistPortraits/{sanitized_name}.jpg"
 
+            # Same portrait already fetched this run: hard-link it (copy where links aren't supported)
+            source_path = self._downloaded_images.get(image_url)
+            if source_path is not None and source_path.exists():
+                file_path = self.images_dir / f"{sanitized_name}{source_path.suffix}"
+                try:
+                    os.link(source_path, file_path)
+                except OSError:
+                    shutil.copyfile(source_path, file_path)
+                self._existing_images[sanitized_name] = source_path.suffix
+                self.logger.info(f"Reused image {source_path.name} for: {artist_name}")
+                return f"03_Resources/source_material/ArtistPortraits/{file_path.name}"
+
             # Download new image
             response = self.session.get(image_url, timeout=REQUEST_TIMEOUT, stream=True)
 
@@ -292,9 +1081,12 @@ class ArtistDiscoveryPipeline:
 
                 file_path = self.images_dir / f"{sanitized_name}{extension}"
 
+                # Copy the raw stream in large C-level chunks instead of 8 KiB Python iterations
+                response.raw.decode_content = True
                 with open(file_path, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
+                    shutil.copyfileobj(response.raw, f, length=IMAGE_COPY_CHUNK_SIZE)
+                self._existing_images[sanitized_name] = extension
+                self._downloaded_images[image_url] = file_path
 
                 self.logger.info(f"Downloaded image: {file_path}")
                 return f"03_Resources/source_material/ArtistPortraits/{sanitized_name}{extension}"
@@ -308,7 +1100,43 @@ class ArtistDiscoveryPipeline:
 
     # === MUSICBRAINZ API METHODS ===
 
-    def calculate_match_confidence(self, artist: Dict[str, Any], search_name: str, spotify_genres: List[str] = None) -> int:
+    def _musicbrainz_get(self, path: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Rate-limited GET against the MusicBrainz web service, requesting JSON.
+
+        Goes through the pooled session (keep-alive to musicbrainz.org) and skips
+        musicbrainzngs' XML parsing. Transient errors (503 = over the rate limit) are retried
+        with backoff, each attempt waiting on the limiter again. Returns the decoded body, or
+        None on a non-200 response.
+        """
+        delay = 0.0
+        for attempt in range(MUSICBRAINZ_RETRY_ATTEMPTS):
+            if delay:
+                time.sleep(delay)
+            self.musicbrainz_limiter.wait()
+            response = self.session.get(
+                f"{MUSICBRAINZ_API_BASE}/{path}",
+                params={**params, 'fmt': 'json'},
+                headers={'User-Agent': MUSICBRAINZ_USER_AGENT, 'Accept': 'application/json'},
+                timeout=REQUEST_TIMEOUT
+            )
+            if response.status_code not in HTTP_RETRY_STATUSES:
+                break
+            # Exponential backoff, or the server's Retry-After when longer (clamped like the adapter's)
+            delay = float(2 ** attempt)
+            retry_after = response.headers.get('Retry-After', '')
+            if retry_after.isdigit():
+                delay = max(delay, min(float(retry_after), HTTP_RETRY_AFTER_MAX))
+            self.logger.warning(f"MusicBrainz request returned {response.status_code} ({path}), "
+                                f"attempt {attempt + 1}/{MUSICBRAINZ_RETRY_ATTEMPTS}")
+
+        if response.status_code != 200:
+            self.logger.error(f"MusicBrainz request failed ({path}): {response.status_code}")
+            return None
+        return orjson.loads(response.content)
+
+    def calculate_match_confidence(self, artist: Dict[str, Any], normalized_search: str,
+                                   genre_keywords: frozenset = frozenset()) -> int:
         """
         Calculate confidence score (0-100) for a MusicBrainz match.
 
@@ -317,12 +1145,12 @@ class ArtistDiscoveryPipeline:
         - Name matching: 0-40 points (exact match = 40, partial = 20)
         - Genre validation: 0-20 points (keyword overlap in disambiguation)
 
-        Perfect score (100) = ext:score 100 + exact name + genre match
+        Perfect score (100) = search score 100 + exact name + genre match
 
         Args:
             artist: MusicBrainz artist dict
-            search_name: Original search query
-            spotify_genres: Optional Spotify genres for validation
+            normalized_search: Search query, already normalized with _normalize_name
+            genre_keywords: Spotify genre keywords from _genre_keywords (may be empty)
 
         Returns:
             Confidence score (0-100)
@@ -330,18 +1158,17 @@ class ArtistDiscoveryPipeline:
         confidence = 0
 
         # 1. Base score from MusicBrainz search ranking (0-40 points)
-        # MB returns 'ext:score' in search results (0-100)
-        mb_score = int(artist.get('ext:score', 0))
+        # MB returns 'score' in search results (0-100)
+        mb_score = int(artist.get('score', 0))
         confidence += (mb_score / 100) * 40  # Normalize to 0-40
 
         # 2. Name matching (0-40 points)
-        artist_name = artist.get('name', '').lower().strip()
-        search_name_norm = search_name.lower().strip()
+        artist_name = _normalize_name(artist.get('name', ''))
 
-        if artist_name == search_name_norm:
+        if artist_name == normalized_search:
             # Exact match
             confidence += 40
-        elif artist_name in search_name_norm or search_name_norm in artist_name:
+        elif artist_name in normalized_search or normalized_search in artist_name:
             # Partial match (e.g., "The Band" matches "ALEX LEACH BAND")
             confidence += 20
         else:
@@ -349,17 +1176,11 @@ class ArtistDiscoveryPipeline:
             confidence += 0
 
         # 3. Genre validation via disambiguation (0-20 points)
-        if spotify_genres:
-            disambiguation = artist.get('disambiguation', '').lower()
-            if disambiguation:
-                genre_keywords = set()
-                for genre in spotify_genres:
-                    genre_keywords.update(genre.lower().split())
-
-                # Count keyword matches
-                matches = sum(1 for keyword in genre_keywords if keyword in disambiguation)
-                if matches > 0:
-                    confidence += min(matches * 5, 20)  # Up to 20 points (4+ matches = max)
+        if genre_keywords:
+            # Count keyword matches
+            matches = len(genre_keywords & _disambiguation_tokens(artist))
+            if matches > 0:
+                confidence += min(matches * 5, 20)  # Up to 20 points (4+ matches = max)
 
         return min(int(confidence), 100)  # Cap at 100
 
@@ -383,43 +1204,60 @@ class ArtistDiscoveryPipeline:
             Tuple of (artist_dict, confidence_score) if match found with sufficient confidence,
             or None if no match or confidence too low
         """
+        # A recent search that found no confident match would only repeat (and cost a rate-limit slot)
+        miss_key = (artist_name, ','.join(sorted(spotify_genres or [])), str(min_confidence))
+        if not self.force and self.api_cache.get('musicbrainz_miss', *miss_key,
+                                                 max_age=API_CACHE_MISS_TTL_DAYS * 86400):
+            self.logger.info(f"Skipping MusicBrainz search for {artist_name} (no confident match on a recent run)")
+            return None
+
         try:
             # Search for top 10 candidates
-            result = musicbrainzngs.search_artists(artist=artist_name, limit=10)
+            escaped_name = _LUCENE_SPECIAL_RE.sub(r'\\\1', artist_name)
+            result = self._musicbrainz_get('artist', {'query': f"artist:({escaped_name})", 'limit': 10})
 
-            if not result.get('artist-list'):
+            if result is None:
+                return None
+            if not result.get('artists'):
+                self.api_cache.set('musicbrainz_miss', *miss_key, value=True)
                 return None
 
-            candidates = result['artist-list']
+            candidates = result['artists']
+
+            # Normalize the query and genre keywords once for every candidate comparison
+            normalized_search = _normalize_name(artist_name)
+            genre_keywords = _genre_keywords(spotify_genres)
+
+            # Fast path: MB's top hit is a perfect-score exact name match with no same-named rival,
+            # so genre disambiguation could not pick anything else
+            first = candidates[0]
+            if (int(first.get('score', 0)) == 100
+                    and _normalize_name(first.get('name', '')) == normalized_search
+                    and not any(_normalize_name(artist.get('name', '')) == normalized_search
+                                for artist in candidates[1:])):
+                self.logger.debug("Top search hit is an unambiguous exact match for '%s'", artist_name)
+                confidence = self.calculate_match_confidence(first, normalized_search, genre_keywords)
+                return self._accept_musicbrainz_match(artist_name, first, confidence, min_confidence, miss_key)
 
             # Phase 1: Filter for exact name matches (case-insensitive)
-            normalized_search = artist_name.lower().strip()
             exact_matches = [
                 artist for artist in candidates
-                if artist.get('name', '').lower().strip() == normalized_search
+                if _normalize_name(artist.get('name', '')) == normalized_search
             ]
 
             if exact_matches:
                 candidates = exact_matches
-                self.logger.debug(f"Found {len(exact_matches)} exact name matches for '{artist_name}'")
+                self.logger.debug("Found %d exact name matches for '%s'", len(exact_matches), artist_name)
 
             # Phase 2: If we have multiple candidates and Spotify genres, score by genre relevance
-            if len(candidates) > 1 and spotify_genres:
-                genre_keywords = set()
-                for genre in spotify_genres:
-                    # Extract keywords from genre strings (e.g., "east coast hip hop" -> ["east", "coast", "hip", "hop"])
-                    genre_keywords.update(genre.lower().split())
-
+            if len(candidates) > 1 and genre_keywords:
                 scored_candidates = []
                 for artist in candidates:
-                    score = 0
-                    disambiguation = artist.get('disambiguation', '').lower()
-                    artist_type = artist.get('type', '').lower()
+                    disambiguation = artist.get('disambiguation') or ''
+                    artist_type = (artist.get('type') or '').lower()
 
-                    # Check for genre keyword overlap in disambiguation
-                    for keyword in genre_keywords:
-                        if keyword in disambiguation:
-                            score += 2  # Strong signal
+                    # Check for genre keyword overlap in disambiguation (strong signal)
+                    score = 2 * len(genre_keywords & _disambiguation_tokens(artist))
 
                     # Bonus for having disambiguation info (more detailed entry)
                     if disambiguation:
@@ -437,8 +1275,8 @@ class ArtistDiscoveryPipeline:
                 # If top candidate has significantly better score, use it
                 if scored_candidates[0][0] > 0:
                     best_match = scored_candidates[0][1]
-                    self.logger.debug(f"Selected match with genre score {scored_candidates[0][0]}: "
-                                    f"{best_match.get('name')} - {best_match.get('disambiguation', 'no disambiguation')}")
+                    self.logger.debug("Selected match with genre score %s: %s - %s", scored_candidates[0][0],
+                                      best_match.get('name'), best_match.get('disambiguation', 'no disambiguation'))
                 else:
                     best_match = candidates[0]
             else:
@@ -446,82 +1284,117 @@ class ArtistDiscoveryPipeline:
                 best_match = candidates[0]
 
             # Phase 4: Calculate confidence and validate threshold
-            confidence = self.calculate_match_confidence(best_match, artist_name, spotify_genres)
-
-            if confidence < min_confidence:
-                disambiguation = best_match.get('disambiguation', 'no disambiguation')
-                self.logger.warning(
-                    f"Low confidence match ({confidence}%) for '{artist_name}' -> "
-                    f"'{best_match.get('name')}' ({disambiguation}). "
-                    f"Skipping MusicBrainz enrichment (threshold: {min_confidence}%)"
-                )
-                return None
-
-            self.logger.info(f"Match confidence: {confidence}% for '{best_match.get('name')}'")
-            return (best_match, confidence)
+            confidence = self.calculate_match_confidence(best_match, normalized_search, genre_keywords)
+            return self._accept_musicbrainz_match(artist_name, best_match, confidence, min_confidence, miss_key)
 
         except Exception as e:
             self.logger.error(f"Error searching MusicBrainz for '{artist_name}': {e}")
             return None
 
-    def get_musicbrainz_metadata(self, artist_name: str, spotify_genres: List[str] = None) -> Optional[Dict[str, Any]]:
+    def _accept_musicbrainz_match(self, artist_name: str, best_match: Dict[str, Any], confidence: int,
+                                  min_confidence: int, miss_key: Tuple[str, ...]) -> Optional[Tuple[Dict[str, Any], int]]:
+        """Apply the confidence threshold to a chosen candidate, caching a miss when it falls short."""
+        if confidence < min_confidence:
+            disambiguation = best_match.get('disambiguation', 'no disambiguation')
+            self.logger.warning(
+                f"Low confidence match ({confidence}%) for '{artist_name}' -> "
+                f"'{best_match.get('name')}' ({disambiguation}). "
+                f"Skipping MusicBrainz enrichment (threshold: {min_confidence}%)"
+            )
+            self.api_cache.set('musicbrainz_miss', *miss_key, value=True)
+            return None
+
+        self.logger.info(f"Match confidence: {confidence}% for '{best_match.get('name')}'")
+        return (best_match, confidence)
+
+    def get_musicbrainz_metadata(self, artist_name: str, spotify_genres: List[str] = None,
+                                 known_mbid: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
         Get comprehensive MusicBrainz metadata for an artist.
 
         Args:
             artist_name: Name of artist to search for
             spotify_genres: Optional Spotify genres for better matching
+            known_mbid: MBID already recorded for this artist (e.g. in the existing card);
+                        skips the search phase entirely
 
         Returns dict with: mbid, birth_date, death_date, origin, instruments, aliases,
                           tags, members, original_members, collaborators, artist_type, gender
 
         Returns None if no match found or confidence below threshold
         """
+        genres_key = ','.join(sorted(spotify_genres or []))
+        cached = self.api_cache.get('musicbrainz', artist_name, genres_key)
+        if cached is not None:
+            self.logger.info(f"Using cached MusicBrainz metadata for: {artist_name}")
+            return cached
+
+        collaborators_future = None
         try:
-            self.logger.info(f"Searching MusicBrainz for: {artist_name}")
+            # Reuse an MBID from the card or from an earlier confident match for the same
+            # name and genres (unless --force)
+            mbid = known_mbid
+            if not mbid and not self.force:
+                mbid = self.api_cache.get('mbid', artist_name, genres_key, max_age=API_CACHE_MBID_TTL_DAYS * 86400)
+
+            if mbid:
+                self.logger.info(f"Using known MusicBrainz MBID for {artist_name}: {mbid}")
+            else:
+                self.logger.info(f"Searching MusicBrainz for: {artist_name}")
 
-            # Use improved matching logic with confidence scoring
-            match_result = self.find_best_musicbrainz_match(artist_name, spotify_genres)
+                # Use improved matching logic with confidence scoring
+                match_result = self.find_best_musicbrainz_match(artist_name, spotify_genres)
 
-            if not match_result:
-                self.logger.info(f"No confident MusicBrainz match for: {artist_name} (skipping enrichment)")
-                return None
+                if not match_result:
+                    self.logger.info(f"No confident MusicBrainz match for: {artist_name} (skipping enrichment)")
+                    return None
 
-            artist, confidence = match_result
-            mbid = artist.get('id')
+                artist, confidence = match_result
+                mbid = artist.get('id')
 
-            if not mbid:
-                self.logger.warning(f"No MBID found for: {artist_name}")
-                return None
+                if not mbid:
+                    self.logger.warning(f"No MBID found for: {artist_name}")
+                    return None
 
-            disambiguation = artist.get('disambiguation', '')
-            if disambiguation:
-                self.logger.info(f"Found MusicBrainz artist ({confidence}% confidence): {artist.get('name')} ({disambiguation}) - MBID: {mbid}")
-            else:
-                self.logger.info(f"Found MusicBrainz artist ({confidence}% confidence): {artist.get('name')} (MBID: {mbid})")
+                disambiguation = artist.get('disambiguation', '')
+                if disambiguation:
+                    self.logger.info(f"Found MusicBrainz artist ({confidence}% confidence): {artist.get('name')} ({disambiguation}) - MBID: {mbid}")
+                else:
+                    self.logger.info(f"Found MusicBrainz artist ({confidence}% confidence): {artist.get('name')} (MBID: {mbid})")
+                self.api_cache.set('mbid', artist_name, genres_key, value=mbid)
+
+                # Browse recordings for collaborators while the detailed lookup runs; the shared
+                # limiter still spaces the two requests, but their round-trips overlap. A reused
+                # MBID may be stale, so its browse waits until the lookup below succeeds.
+                collaborators_future = self._musicbrainz_followup_executor.submit(
+                    self.extract_collaborators_from_musicbrainz, mbid
+                )
 
             # Fetch detailed artist information with relationships
-            time.sleep(MUSICBRAINZ_RATE_LIMIT)
-            detailed = musicbrainzngs.get_artist_by_id(
-                mbid,
-                includes=['artist-rels', 'recording-rels', 'aliases', 'tags', 'ratings']
+            artist_data = self._musicbrainz_get(
+                f'artist/{mbid}',
+                {'inc': 'artist-rels+recording-rels+aliases+tags+ratings'}
             )
-
-            artist_data = detailed.get('artist', {})
+            if not artist_data:
+                return None
+            if collaborators_future is None:
+                collaborators_future = self._musicbrainz_followup_executor.submit(
+                    self.extract_collaborators_from_musicbrainz, mbid
+                )
 
             # Extract basic metadata
             metadata = {
                 'mbid': mbid,
                 'name': artist_data.get('name', artist_name),
-                'sort_name': artist_data.get('sort-name', ''),
-                'artist_type': artist_data.get('type', ''),  # Person, Group, Orchestra, etc.
-                'gender': artist_data.get('gender', ''),  # Male, Female, Other, Not applicable
-                'disambiguation': artist_data.get('disambiguation', ''),
+                'sort_name': artist_data.get('sort-name') or '',
+                'artist_type': artist_data.get('type') or '',  # Person, Group, Orchestra, etc.
+                'gender': artist_data.get('gender') or '',  # Male, Female, Other, Not applicable
+                'disambiguation': artist_data.get('disambiguation') or '',
             }
 
             # Extract birth/death dates from life-span
-            life_span = artist_data.get('life-span', {})
-            artist_type = artist_data.get('type', '').lower()
+            life_span = artist_data.get('life-span') or {}
+            artist_type = (artist_data.get('type') or '').lower()
 
             if life_span.get('begin'):
                 metadata['birth_date'] = life_span['begin']
@@ -533,48 +1406,53 @@ class ArtistDiscoveryPipeline:
 
             # Extract origin/birth place
             if artist_data.get('area'):
-                metadata['country'] = artist_data['area'].get('name', '')
+                metadata['country'] = artist_data['area'].get('name') or ''
             if artist_data.get('begin-area'):
-                metadata['origin'] = artist_data['begin-area'].get('name', '')
+                metadata['origin'] = artist_data['begin-area'].get('name') or ''
+
+            # JSON lookups return every relationship in one list, tagged by target type
+            relations = artist_data.get('relations') or []
+            artist_relations = [rel for rel in relations if rel.get('target-type') == 'artist']
+            recording_relations = [rel for rel in relations if rel.get('target-type') == 'recording']
 
             # Extract instruments (for Person type)
-            instruments = []
-            for rel in artist_data.get('artist-relation-list', []):
+            instruments = set()
+            for rel in artist_relations:
                 if rel.get('type') == 'member of band':
                     # Extract instruments from attributes
-                    for attr in rel.get('attribute-list', []):
-                        if attr not in instruments:
-                            instruments.append(attr)
+                    instruments.update(rel.get('attributes') or [])
 
             # Also check recording relations for instruments
-            for rel in artist_data.get('recording-relation-list', []):
-                for attr in rel.get('attribute-list', []):
-                    if attr not in instruments and ('vocal' in attr.lower() or 'guitar' in attr.lower() or 'piano' in attr.lower()):
-                        instruments.append(attr)
+            for rel in recording_relations:
+                for attr in rel.get('attributes') or []:
+                    attr_lower = attr.lower()
+                    if any(token in attr_lower for token in _INSTRUMENT_TOKENS):
+                        instruments.add(attr)
 
             if instruments:
-                metadata['instruments'] = instruments
+                metadata['instruments'] = sorted(instruments)
 
             # Extract aliases
             aliases = []
-            for alias in artist_data.get('alias-list', []):
-                alias_name = alias.get('name', '')
+            for alias in artist_data.get('aliases') or []:
+                alias_name = alias.get('name') or ''
                 if alias_name and alias_name != artist_name:
                     aliases.append(alias_name)
             if aliases:
                 metadata['aliases'] = aliases[:5]  # Limit to 5 most relevant
 
-            # Extract tags (top 3 genre tags)
+            # Extract tags (top 3 genre tags, most-voted first)
             tags = []
-            for tag in artist_data.get('tag-list', [])[:10]:  # Get top 10
-                tag_name = tag.get('name', '')
+            ranked_tags = sorted(artist_data.get('tags') or [], key=lambda tag: tag.get('count', 0), reverse=True)
+            for tag in ranked_tags[:10]:  # Get top 10
+                tag_name = tag.get('name') or ''
                 if tag_name:
                     tags.append(tag_name)
             if tags:
                 metadata['tags'] = tags[:3]  # Top 3 for display
 
             # Parse member relationships (context-aware: members for groups, associated acts for individuals)
-            members, original_members = self.parse_member_relationships(artist_data, artist_type)
+            members, original_members = self.parse_member_relationships(artist_relations, artist_type)
             if members:
                 # For individuals: these are associated acts (bands they belong to)
                 # For groups: these are band members
@@ -585,25 +1463,27 @@ class ArtistDiscoveryPipeline:
             if original_members:
                 metadata['original_members'] = original_members
 
-            # Extract collaborators from recordings
-            collaborators = self.extract_collaborators_from_musicbrainz(mbid)
+            # Collect collaborators from the recording browse started above
+            collaborators = collaborators_future.result()
             if collaborators:
                 metadata['collaborators'] = collaborators
 
             self.logger.info(f"MusicBrainz metadata extracted: {len(metadata)} fields")
+            self.api_cache.set('musicbrainz', artist_name, genres_key, value=metadata)
             return metadata
 
-        except musicbrainzngs.NetworkError as e:
+        except requests.exceptions.RequestException as e:
             self.logger.error(f"MusicBrainz network error for {artist_name}: {e}")
             return None
-        except musicbrainzngs.ResponseError as e:
-            self.logger.error(f"MusicBrainz response error for {artist_name}: {e}")
-            return None
         except Exception as e:
             self.logger.error(f"Error getting MusicBrainz metadata for {artist_name}: {e}")
             return None
+        finally:
+            # Don't spend a limiter slot on a browse whose result would be dropped
+            if collaborators_future is not None:
+                collaborators_future.cancel()
 
-    def parse_member_relationships(self, artist_data: Dict[str, Any], artist_type: str = '') -> Tuple[List[Dict], List[Dict]]:
+    def parse_member_relationships(self, artist_relations: List[Dict[str, Any]], artist_type: str = '') -> Tuple[List[Dict], List[Dict]]:
         """
         Parse member and original member relationships from MusicBrainz artist data.
 
@@ -612,7 +1492,7 @@ class ArtistDiscoveryPipeline:
         - For Individuals: Returns (associated_acts_list, []) - bands/groups they belong to
 
         Args:
-            artist_data: MusicBrainz artist data dictionary
+            artist_relations: Artist-to-artist relations from a MusicBrainz JSON lookup
             artist_type: 'Person', 'Group', 'Band', etc. from MusicBrainz
 
         Returns: (members/associated_acts list, original_members list)
@@ -622,20 +1502,21 @@ class ArtistDiscoveryPipeline:
         artist_type_lower = artist_type.lower()
 
         try:
-            for rel in artist_data.get('artist-relation-list', []):
+            for rel in artist_relations:
                 if rel.get('type') == 'member of band':
-                    member_artist = rel.get('artist', {})
-                    member_name = member_artist.get('name', '')
+                    member_artist = rel.get('artist') or {}
+                    member_name = member_artist.get('name') or ''
 
                     if not member_name:
                         continue
 
-                    # Extract time period
-                    begin = rel.get('begin', '')
-                    end = rel.get('end', '')
+                    # Extract time period (null in JSON when unknown)
+                    begin = rel.get('begin') or ''
+                    end = rel.get('end') or ''
 
                     # Extract instruments/roles from attributes
-                    instruments_roles = rel.get('attribute-list', [])
+                    instruments_roles = rel.get('attributes') or []
+                    attrs_lower = {attr.lower() for attr in instruments_roles}
 
                     # Build member/associated act info
                     member_info = {
@@ -655,10 +1536,10 @@ class ArtistDiscoveryPipeline:
                     else:
                         # Group/Band - relationships are band members
                         # Determine if original member
-                        if 'original' in str(rel.get('attribute-list', [])).lower() or not end or end == '':
+                        if 'original' in attrs_lower or not end:
                             members.append(member_info)
                             # Also add to original if founding member
-                            if 'founder' in str(rel.get('attribute-list', [])).lower() or (begin and not end):
+                            if 'founder' in attrs_lower or (begin and not end):
                                 original_members.append(member_info)
                         else:
                             members.append(member_info)
@@ -676,27 +1557,30 @@ class ArtistDiscoveryPipeline:
         Returns: List of unique collaborator artist names (deduplicated)
         """
         try:
-            # Get artist's recordings with artist credits
-            time.sleep(MUSICBRAINZ_RATE_LIMIT)
-
-            # Browse recordings by artist
-            recordings = musicbrainzngs.browse_recordings(artist=mbid, limit=100)
+            # Browse the artist's recordings with artist credits
+            recordings = self._musicbrainz_get(
+                'recording',
+                {'artist': mbid, 'inc': 'artist-credits', 'limit': 100}
+            )
+            if not recordings:
+                return []
 
-            collaborators = set()
+            collaborators = Counter()
 
-            for recording in recordings.get('recording-list', []):
+            for recording in recordings.get('recordings') or []:
                 # Check artist-credit for collaborations
-                for credit in recording.get('artist-credit', []):
+                for credit in recording.get('artist-credit') or []:
                     if isinstance(credit, dict):
                         artist = credit.get('artist', {})
                         artist_name = artist.get('name', '')
 
                         # Skip if it's the same artist
                         if artist.get('id') != mbid and artist_name:
-                            collaborators.add(artist_name)
+                            collaborators[artist_name] += 1
 
             self.logger.info(f"Found {len(collaborators)} unique collaborators from MusicBrainz")
-            return sorted(list(collaborators))[:20]  # Limit to top 20
+            # Keep the 20 most frequent collaborators
+            return [name for name, _ in collaborators.most_common(20)]
 
         except Exception as e:
             self.logger.error(f"Error extracting collaborators from MusicBrainz: {e}")
@@ -710,36 +1594,44 @@ class ArtistDiscoveryPipeline:
         Returns: Deduplicated list of collaborator dicts with wikilink format
         """
         try:
-            # Normalize function for comparison
-            def normalize(name: str) -> str:
-                return name.lower().strip().replace('.', '').replace(',', '')
-
-            # Build set of normalized names from Perplexity (already have details)
-            perplexity_names = set()
-            result = []
+            # Normalized name -> collaborator; doubles as the membership check and the output
+            merged: Dict[str, Dict[str, Any]] = {}
 
             # Add Perplexity collaborators first (they have context)
             for collab in perplexity_collaborators:
                 if isinstance(collab, dict):
                     name = collab.get('name', '')
                     if name:
-                        perplexity_names.add(normalize(name))
-                        result.append(collab)
-
-            # Add MusicBrainz collaborators if not already in list
-            for mb_name in mb_collaborators:
-                normalized = normalize(mb_name)
-                if normalized not in perplexity_names:
-                    # Add as simple collaborator dict
-                    result.append({
-                        'name': mb_name,
-                        'context': 'Collaborated on recordings',
-                        'specific_works': '',
-                        'time_period': '',
-                        'source': 'musicbrainz'
-                    })
-                    perplexity_names.add(normalized)
+                        merged.setdefault(_normalize_collaborator(name), collab)
+
+            # Add MusicBrainz collaborators if not already in list (keys normalized in one batch);
+            # the reversed zip keeps the first spelling seen for each key
+            mb_keys = [name.lower().strip().translate(_COLLABORATOR_STRIP_TABLE) for name in mb_collaborators]
+            mb_names = dict(zip(reversed(mb_keys), reversed(mb_collaborators)))
+            new_keys = [normalized for normalized in dict.fromkeys(mb_keys) if normalized not in merged]
+
+            # Spelling variants ("Allen Touissant") slip past normalization; drop MB names
+            # that closely match a Perplexity collaborator, which carries the richer context
+            if new_keys and merged:
+                perplexity_keys = list(merged)
+                new_keys = [
+                    normalized for normalized in new_keys
+                    if not process.extractOne(normalized, perplexity_keys, scorer=fuzz.ratio,
+                                              score_cutoff=COLLABORATOR_FUZZY_MIN_SCORE)
+                ]
+
+            merged.update(
+                (normalized, {
+                    'name': mb_names[normalized],
+                    'context': 'Collaborated on recordings',
+                    'specific_works': '',
+                    'time_period': '',
+                    'source': 'musicbrainz'
+                })
+                for normalized in new_keys
+            )
 
+            result = list(merged.values())
             self.logger.info(f"Deduplicated collaborators: {len(result)} total ({len(perplexity_collaborators)} from Perplexity, {len(mb_collaborators)} from MusicBrainz)")
             return result
 
@@ -761,11 +1653,24 @@ class ArtistDiscoveryPipeline:
                 self.logger.error("PERPLEXITY_API_KEY environment variable is required")
                 return False
 
+            # Imported here: the OpenAI SDK is slow to import and unused by --help and dry runs
+            import httpx
+            from openai import OpenAI, DefaultHttpxClient
+
+            # Multiplex concurrent research calls over one HTTP/2 connection when the optional
+            # h2 package is installed; otherwise keep one HTTP/1.1 keep-alive connection per slot
+            http2 = importlib.util.find_spec('h2') is not None
             self.perplexity_client = OpenAI(
                 api_key=api_key,
-                base_url=PERPLEXITY_API_BASE
+                base_url=PERPLEXITY_API_BASE,
+                http_client=DefaultHttpxClient(
+                    http2=http2,
+                    limits=httpx.Limits(max_connections=PERPLEXITY_MAX_IN_FLIGHT,
+                                        max_keepalive_connections=PERPLEXITY_MAX_IN_FLIGHT)
+                )
             )
-            self.logger.info(f"Initialized Perplexity client with model: {PERPLEXITY_MODEL}")
+            self.logger.info(f"Initialized Perplexity client with model: {PERPLEXITY_MODEL}"
+                             f"{' (HTTP/2)' if http2 else ''}")
             return True
 
         except Exception as e:
@@ -796,10 +1701,18 @@ class ArtistDiscoveryPipeline:
                 'entity_type': "individual"
             }
 
+        genres = spotify_metadata.get('genres', [])
+        cache_key = (artist_name, ','.join(sorted(genres)), f"{PERPLEXITY_MODEL}/v{PERPLEXITY_PROMPT_VERSION}")
+        cached = self.api_cache.get('perplexity', *cache_key)
+        if cached is not None:
+            self.logger.info(f"Using cached Perplexity research for: {artist_name}")
+            # Callers edit the result (merged collaborators), so never hand out the cached object;
+            # an orjson round-trip is a cheap deep copy of plain JSON data
+            return orjson.loads(orjson.dumps(cached))
+
         try:
             # Extract Spotify context
             top_tracks = spotify_metadata.get('top_tracks', [])[:3] if 'top_tracks' in spotify_metadata else []
-            genres = spotify_metadata.get('genres', [])
 
             # Build research prompt
             research_prompt = f"""Research the musical artist "{artist_name}" and provide comprehensive biographical information.
@@ -845,21 +1758,22 @@ Only include verified information from credible sources."""
 
             self.logger.info(f"Researching artist with Perplexity: {artist_name}")
 
-            response = self.perplexity_client.chat.completions.create(
-                model=PERPLEXITY_MODEL,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert music researcher with access to web search. Provide accurate, well-researched information. Always respond with valid JSON only."
-                    },
-                    {
-                        "role": "user",
-                        "content": research_prompt
-                    }
-                ],
-                temperature=PERPLEXITY_TEMPERATURE,
-                max_tokens=PERPLEXITY_MAX_TOKENS
-            )
+            with self.perplexity_limiter:
+                response = self.perplexity_client.chat.completions.create(
+                    model=PERPLEXITY_MODEL,
+                    messages=[
+                        {
+                            "role": "system",
+                            "content": "You are an expert music researcher with access to web search. Provide accurate, well-researched information. Always respond with valid JSON only."
+                        },
+                        {
+                            "role": "user",
+                            "content": research_prompt
+                        }
+                    ],
+                    temperature=PERPLEXITY_TEMPERATURE,
+                    max_tokens=PERPLEXITY_MAX_TOKENS
+                )
 
             # Parse JSON response
             if not response or not hasattr(response, 'choices') or not response.choices:
@@ -874,21 +1788,22 @@ Only include verified information from credible sources."""
             elif response_text.startswith('```'):
                 response_text = response_text.replace('```', '').strip()
 
-            research_data = json.loads(response_text)
+            research_data = orjson.loads(response_text)
 
             # Add confidence scores to connections
-            for conn_type in ['mentors', 'collaborators', 'influenced']:
-                if conn_type in research_data.get('connections', {}):
-                    for connection in research_data['connections'][conn_type]:
-                        if 'confidence' not in connection:
-                            connection['confidence'] = 0.95
+            connections = research_data.get('connections', {})
+            for conn_type in ('mentors', 'collaborators', 'influenced'):
+                for connection in connections.get(conn_type, ()):
+                    connection.setdefault('confidence', 0.95)
 
             self.logger.info(f"Research successful: {len(research_data.get('biography', ''))} chars biography")
 
-            return {
+            result = {
                 'success': True,
                 **research_data
             }
+            self.api_cache.set('perplexity', *cache_key, value=result)
+            return orjson.loads(orjson.dumps(result))  # the cache keeps `result` itself
 
         except Exception as e:
             self.logger.error(f"Error researching with Perplexity for {artist_name}: {e}")
@@ -902,28 +1817,14 @@ Only include verified information from credible sources."""
             with open(archive_path, 'r', encoding='utf-8') as file:
                 content = file.read()
 
-            lines = content.split('\n')
             found_artists = []
 
-            for line in lines:
-                line = line.strip()
-
-                if not line:
-                    continue
-
-                # Check if this is a table row (starts with |)
-                if line.startswith('|') and '|' in line[1:]:
-                    columns = [col.strip() for col in line.split('|')]
-
-                    # Skip header rows and separator rows
-                    if len(columns) >= 9 and columns[1] not in ['Time', ':----', '']:
-                        artist = columns[2].strip()
-                        status = columns[8].strip()
-
-                        # Check if status is "✅ Found"
-                        if status == "✅ Found" and artist:
-                            found_artists.append(artist)
-                            self.logger.debug(f"Found artist: {artist}")
+            # One pass over the buffer picks out table rows whose status column is "✅ Found"
+            for time_column, artist in _ARCHIVE_ROW_RE.findall(content):
+                # Skip header rows and separator rows
+                if time_column not in ('Time', ':----', '') and artist:
+                    found_artists.append(artist)
+                    self.logger.debug("Found artist: %s", artist)
 
             self.logger.info(f"Parsed {len(found_artists)} artists from {archive_path}")
             return found_artists
@@ -933,30 +1834,8 @@ Only include verified information from credible sources."""
             return []
 
     def sanitize_filename(self, name: str) -> str:
-        """
-        Sanitize artist name for use as filename with normalization.
-
-        Converts to lowercase first to prevent duplicates like:
-        - "DR. JOHN" -> "dr_john.md"
-        - "Dr. John" -> "dr_john.md"
-        - "dr john" -> "dr_john.md"
-        """
-        # Normalize to lowercase first to prevent case-based duplicates
-        sanitized = name.lower()
-
-        # Replace spaces with underscores
-        sanitized = sanitized.replace(' ', '_')
-
-        # Remove or replace special characters
-        sanitized = re.sub(r'[<>:"/\\|?*]', '', sanitized)
-        sanitized = re.sub(r'[&]', 'and', sanitized)
-        sanitized = re.sub(r'[^\w\-_.]', '', sanitized)
-
-        # Trim length if needed
-        if len(sanitized) > 200:
-            sanitized = sanitized[:200]
-
-        return sanitized.strip('.')
+        """Sanitize artist name for use as filename (memoized, see _sanitize_filename)."""
+        return _sanitize_filename(name)
 
     def find_existing_card(self, artist_name: str) -> Tuple[bool, Optional[Path], Optional[str]]:
         """
@@ -966,35 +1845,42 @@ Only include verified information from credible sources."""
             (exists, card_path, match_type) where match_type is:
             - "exact": Exact normalized filename match
             - "case_variant": Found a case variation (e.g., "DR._JOHN.md" when looking for "dr_john")
+            - "fuzzy_variant": No card, but a near-identical name exists (e.g., "thelonius_monk" vs
+              "thelonious_monk"); exists is False and card_path is that card, for reporting only.
+              Similar names are often different people ("johnny_adams" vs "john_adams",
+              "ellis_marsalis_jr" vs "ellis_marsalis"), so this is never treated as a duplicate.
             - None: No match found
         """
         sanitized_name = self.sanitize_filename(artist_name)
-        exact_path = self.cards_dir / f"{sanitized_name}.md"
+
+        # Normalize the search name for comparison - remove ALL non-alphanumeric characters.
+        # Every existing card is in the normalized index, so a miss rules out exact and case variants.
+        normalized_search = _NON_ALNUM_RE.sub('', sanitized_name.lower())
+        existing_file = self._card_index.get(normalized_search)
+        if existing_file is None:
+            # Misspellings slip past normalization; surface near-identical names so possible
+            # duplicate cards can be reviewed (the caller still processes the artist)
+            match = process.extractOne(
+                normalized_search, self._fuzzy_card_candidates(normalized_search),
+                scorer=fuzz.ratio, score_cutoff=CARD_FUZZY_MIN_SCORE
+            )
+            if match:
+                return False, self._card_index[match[0]], "fuzzy_variant"
+            return False, None, None
 
         # Check for exact match first
-        if exact_path.exists():
-            return True, exact_path, "exact"
+        if sanitized_name in self._card_sizes:
+            return True, self.cards_dir / f"{sanitized_name}.md", "exact"
 
-        # Check for case variations and punctuation differences
+        # Case variations and punctuation differences
         # This catches existing files like "DR._JOHN.md" or "D'Angelo.md" when looking for "dr_john" or "dangelo"
-        if self.cards_dir.exists():
-            # Normalize the search name for comparison - remove ALL non-alphanumeric characters
-            normalized_search = re.sub(r'[^a-z0-9]', '', sanitized_name.lower())
-
-            for existing_file in self.cards_dir.glob("*.md"):
-                # Normalize existing filename for comparison - remove ALL non-alphanumeric characters
-                existing_normalized = re.sub(r'[^a-z0-9]', '', existing_file.stem.lower())
-
-                if existing_normalized == normalized_search:
-                    self.logger.info(f"Found case/punctuation variant: {existing_file.name} matches {artist_name}")
-                    return True, existing_file, "case_variant"
-
-        return False, None, None
+        self.logger.info(f"Found case/punctuation variant: {existing_file.name} matches {artist_name}")
+        return True, existing_file, "case_variant"
 
     def card_exists(self, artist_name: str) -> Tuple[bool, Optional[Path]]:
         """Check if artist card exists in vault (uses find_existing_card internally)."""
         exists, card_path, _ = self.find_existing_card(artist_name)
-        return exists, card_path
+        return exists, card_path if exists else None
 
     def has_perplexity_enhancement(self, card_path: Path) -> bool:
         """
@@ -1007,27 +1893,45 @@ Only include verified information from credible sources."""
             True if card has 'enhancement_provider: perplexity' in frontmatter
             False otherwise
         """
-        try:
-            with open(card_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+        # Empty cards from the startup scan cannot carry the marker; skip the open()
+        if self._card_sizes.get(card_path.stem) == 0:
+            return False
 
-            # Check for Perplexity enhancement marker in frontmatter
-            if content.startswith('---'):
-                frontmatter_end = content.find('---', 3)
-                if frontmatter_end != -1:
-                    frontmatter_text = content[3:frontmatter_end]
-                    frontmatter = yaml.safe_load(frontmatter_text)
+        try:
+            # One bounded binary read covers the frontmatter; no line splitting or UTF-8 decoding
+            with open(card_path, 'rb') as f:
+                head = f.read(FRONTMATTER_MAX_CHARS)
 
-                    # Strict check: has Perplexity marker?
-                    if frontmatter and frontmatter.get('enhancement_provider') == 'perplexity':
-                        return True
+            if not head.startswith(b'---'):
+                return False
+            end = head.find(b'\n---', 3)
+            if end == -1:
+                return False
 
-            return False
+            # Strict check: has Perplexity marker? (a top-level key, so no YAML parse needed)
+            return _PERPLEXITY_MARKER_BYTES_RE.search(head, 3, end + 1) is not None
 
         except Exception as e:
             self.logger.error(f"Error checking Perplexity enhancement status for {card_path}: {e}")
             return False  # Assume not enhanced on error, will attempt processing
 
+    def get_card_mbid(self, card_path: Path) -> Optional[str]:
+        """Return the musicbrainz_id stored in a card's frontmatter, if any."""
+        try:
+            with open(card_path, 'r', encoding='utf-8') as f:
+                _, frontmatter_text = _read_frontmatter(f)
+
+            if frontmatter_text:
+                frontmatter = yaml.load(frontmatter_text, Loader=_YAML_LOADER)
+                if frontmatter:
+                    return frontmatter.get('musicbrainz_id')
+
+            return None
+
+        except Exception as e:
+            self.logger.warning(f"Could not read MBID from {card_path}: {e}")
+            return None
+
     def should_skip_processing(self, card_path: Path) -> Tuple[bool, str]:
         """
         Comprehensive quality check to determine if artist card should be skipped.
@@ -1042,25 +1946,26 @@ Only include verified information from credible sources."""
         """
         try:
             with open(card_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+                has_frontmatter, frontmatter_text = _read_frontmatter(f)
+
+                if not has_frontmatter:
+                    return False, "No frontmatter found"
 
-            if not content.startswith('---'):
-                return False, "No frontmatter found"
+                if frontmatter_text is None:
+                    return False, "Malformed frontmatter"
 
-            frontmatter_end = content.find('---', 3)
-            if frontmatter_end == -1:
-                return False, "Malformed frontmatter"
+                # Quality check 1: Has Perplexity enhancement? (cheap scan before the YAML parse)
+                if not _PERPLEXITY_MARKER_RE.search(frontmatter_text):
+                    return False, "Not enhanced with Perplexity"
 
-            frontmatter_text = content[3:frontmatter_end]
-            frontmatter_data = yaml.safe_load(frontmatter_text)
+                # Body is only read for cards that reach the biography check
+                body_content = f.read().strip()
+
+            frontmatter_data = yaml.load(frontmatter_text, Loader=_YAML_LOADER)
 
             if not frontmatter_data:
                 return False, "Empty frontmatter"
 
-            # Quality check 1: Has Perplexity enhancement?
-            if frontmatter_data.get('enhancement_provider') != 'perplexity':
-                return False, "Not enhanced with Perplexity"
-
             # Quality check 2: Has valid enhancement timestamp?
             if not frontmatter_data.get('biography_enhanced_at'):
                 return False, "Missing enhancement timestamp"
@@ -1079,7 +1984,6 @@ Only include verified information from credible sources."""
             )
 
             # Quality check 5: Check biography content in body
-            body_content = content[frontmatter_end + 3:].strip()
             has_biography = '## Biography' in body_content and len(body_content) > 500
 
             if not has_biography:
@@ -1107,6 +2011,46 @@ Only include verified information from credible sources."""
             self.logger.error(f"Error in quality check for {card_path}: {e}")
             return False, f"Quality check error: {str(e)[:50]}"
 
+    def _format_member_line(self, entry: Dict[str, Any], period_style: Optional[str] = None) -> str:
+        """
+        Format one Members / Original Members / Associated Acts line.
+
+        period_style 'member' renders "(from X until Y)", 'act' renders "(X–Y)",
+        and None omits the time period (original members).
+        """
+        name = entry.get('name', '')
+        # Use proper Obsidian wikilink format: [[Filename|Display Name]]
+        line = f"- [[{self.sanitize_filename(name)}|{name}]]"
+
+        instruments = entry.get('instruments', [])
+        if instruments:
+            line += f" - {', '.join(instruments)}"
+
+        if period_style:
+            begin = entry.get('begin', '')
+            end = entry.get('end', '')
+            if begin and end:
+                line += f" (from {begin} until {end})" if period_style == 'member' else f" ({begin}–{end})"
+            elif begin:
+                line += f" (from {begin})" if period_style == 'member' else f" ({begin}–present)"
+            elif end:
+                line += f" (until {end})"
+
+        return line + "\n"
+
+    def _format_connection_line(self, connection: Dict[str, Any]) -> str:
+        """Format one Musical Connections line: wikilink, context, (works), [period]."""
+        name = connection.get('name', '')
+        detail_parts = [connection.get('context', '')]
+        works = connection.get('specific_works', '')
+        if works:
+            detail_parts.append(f"({works})")
+        period = connection.get('time_period', '')
+        if period:
+            detail_parts.append(f"[{period}]")
+
+        return f"- [[{self.sanitize_filename(name)}|{name}]] - {' '.join(detail_parts)}\n"
+
     def build_artist_card(self, artist_name: str, spotify_data: Dict[str, Any],
                          musicbrainz_data: Dict[str, Any], perplexity_data: Dict[str, Any],
                          image_path: str) -> str:
@@ -1150,7 +2094,7 @@ Only include verified information from credible sources."""
         # Fallback: If no MusicBrainz type but has members data, likely a group
         elif mb_members and not mb_artist_type:
             entity_type = 'group'
-            self.logger.debug(f"Inferred entity_type=group from members data for {artist_name}")
+            self.logger.debug("Inferred entity_type=group from members data for %s", artist_name)
 
         # Merge origin/birth_place: MusicBrainz has priority for structured data
         if mb_origin:
@@ -1159,14 +2103,10 @@ Only include verified information from credible sources."""
             location_full = mb_country
 
         # Convert connections to simple format for frontmatter
-        simple_connections = {}
-        for conn_type in ['mentors', 'collaborators', 'influenced']:
-            if conn_type in connections:
-                simple_connections[conn_type] = [
-                    conn.get('name', '') for conn in connections[conn_type] if isinstance(conn, dict)
-                ]
+        simple_connections = _simple_connections(connections)
 
-        # Build YAML frontmatter
+        # Build YAML frontmatter (one timestamp shared by all date fields)
+        now_iso = datetime.now().isoformat()
         frontmatter = {
             'title': artist_name,
             'status': 'active',
@@ -1182,14 +2122,14 @@ Only include verified information from credible sources."""
             'research_sources': sources,
             'musical_connections': simple_connections,
             'network_extracted': True,
-            'biography_enhanced_at': datetime.now().isoformat(),
+            'biography_enhanced_at': now_iso,
             'external_urls': {
                 'spotify': spotify_url,
                 'wikipedia': wikipedia_url
             },
             'image_path': image_path,
-            'entry_created': datetime.now().isoformat(),
-            'last_updated': datetime.now().isoformat()
+            'entry_created': now_iso,
+            'last_updated': now_iso
         }
 
         # Add MusicBrainz data to frontmatter
@@ -1197,28 +2137,20 @@ Only include verified information from credible sources."""
             frontmatter['musicbrainz_id'] = musicbrainz_data['mbid']
             frontmatter['external_urls']['musicbrainz'] = f"https://musicbrainz.org/artist/{musicbrainz_data['mbid']}"
 
-        if mb_birth_date:
-            frontmatter['birth_date'] = mb_birth_date
-        if mb_death_date:
-            frontmatter['death_date'] = mb_death_date
-        if mb_gender:
-            frontmatter['gender'] = mb_gender
-        if mb_artist_type:
-            frontmatter['artist_type'] = mb_artist_type
-        if mb_disambiguation:
-            frontmatter['disambiguation'] = mb_disambiguation
-        if mb_instruments:
-            frontmatter['instruments'] = mb_instruments
-        if mb_aliases:
-            frontmatter['aliases'] = mb_aliases
-        if mb_tags:
-            frontmatter['tags'] = mb_tags
-        if mb_members:
-            frontmatter['members'] = mb_members
-        if mb_original_members:
-            frontmatter['original_members'] = mb_original_members
-        if mb_associated_acts:
-            frontmatter['associated_acts'] = mb_associated_acts
+        # Optional MusicBrainz fields, in frontmatter order; empty values are left out
+        frontmatter.update((key, value) for key, value in (
+            ('birth_date', mb_birth_date),
+            ('death_date', mb_death_date),
+            ('gender', mb_gender),
+            ('artist_type', mb_artist_type),
+            ('disambiguation', mb_disambiguation),
+            ('instruments', mb_instruments),
+            ('aliases', mb_aliases),
+            ('tags', mb_tags),
+            ('members', mb_members),
+            ('original_members', mb_original_members),
+            ('associated_acts', mb_associated_acts),
+        ) if value)
 
         # Add location based on entity type
         if location_full:
@@ -1230,217 +2162,114 @@ Only include verified information from credible sources."""
         # Build markdown content
         image_filename = image_path.split('/')[-1] if image_path else ''
 
-        content = f"""![]({image_filename})
+        parts: List[str] = [f"""![]({image_filename})
 
 # {artist_name}
 
 ## Quick Info
 - **Genres**: {', '.join(genres[:5]) if genres else 'Not specified'}
-"""
+"""]
 
         # Add instruments (for individuals only)
         if mb_instruments and entity_type == 'individual':
-            content += f"- **Instruments**: {', '.join(mb_instruments)}\n"
+            parts.append(f"- **Instruments**: {', '.join(mb_instruments)}\n")
 
         # Add aliases
         if mb_aliases:
-            content += f"- **Aliases**: {', '.join(mb_aliases)}\n"
+            parts.append(f"- **Aliases**: {', '.join(mb_aliases)}\n")
 
-        content += f"- **Spotify Popularity**: {popularity}/100\n"
-        content += f"- **Followers**: {followers:,}\n"
+        parts.append(f"- **Spotify Popularity**: {popularity}/100\n")
+        parts.append(f"- **Followers**: {followers:,}\n")
 
         # Add birth place/origin
         if location_full:
             if entity_type == 'individual':
                 if mb_birth_date:
-                    content += f"- **Born**: {mb_birth_date}, {location_full}\n"
+                    parts.append(f"- **Born**: {mb_birth_date}, {location_full}\n")
                 else:
-                    content += f"- **Born**: {location_full}\n"
+                    parts.append(f"- **Born**: {location_full}\n")
             elif entity_type in ['band', 'group']:
-                content += f"- **Origin**: {location_full}\n"
+                parts.append(f"- **Origin**: {location_full}\n")
             else:
                 # Safety fallback: If entity_type is ambiguous, check for birth_date
                 # Groups should never have death_date, so use that as indicator
                 if mb_birth_date and not mb_members:
                     # Has birth date, no members → likely individual
-                    content += f"- **Born**: {mb_birth_date}, {location_full}\n"
+                    parts.append(f"- **Born**: {mb_birth_date}, {location_full}\n")
                 else:
                     # No birth date or has members → likely group
-                    content += f"- **Origin**: {location_full}\n"
+                    parts.append(f"- **Origin**: {location_full}\n")
 
         # Add death date (if applicable)
         if mb_death_date:
-            content += f"- **Died**: {mb_death_date}\n"
+            parts.append(f"- **Died**: {mb_death_date}\n")
 
-        content += f"""
+        parts.append(f"""
 ## Biography
 {biography}
 
 *Enhanced with Perplexity AI research*
-"""
+""")
 
         # Add sources (excluding Wikipedia)
         non_wiki_sources = [s for s in sources if 'wikipedia.org' not in s.lower()]
         if non_wiki_sources:
             source_links = [f"[Source{i+1}]({url})" for i, url in enumerate(non_wiki_sources)]
-            content += f"\n*Sources: {', '.join(source_links)}*\n"
+            parts.append(f"\n*Sources: {', '.join(source_links)}*\n")
 
         # Add Fun Facts
         if fun_facts:
-            content += "\n## Fun Facts\n"
+            parts.append("\n## Fun Facts\n")
             for fact in fun_facts:
-                content += f"- {fact}\n"
+                parts.append(f"- {fact}\n")
 
         # Add Members section (for groups/bands) or Associated Acts (for individuals)
         if mb_members and entity_type in ['group', 'band']:
-            content += "\n## Members\n"
-            for member in mb_members:
-                member_name = member.get('name', '')
-                instruments = member.get('instruments', [])
-                begin = member.get('begin', '')
-                end = member.get('end', '')
-
-                # Build member line
-                sanitized_member_name = self.sanitize_filename(member_name)
-                member_line = f"- [[{sanitized_member_name}|{member_name}]]"
-
-                # Add instruments
-                if instruments:
-                    member_line += f" - {', '.join(instruments)}"
-
-                # Add time period
-                if begin or end:
-                    if begin and end:
-                        member_line += f" (from {begin} until {end})"
-                    elif begin:
-                        member_line += f" (from {begin})"
-                    elif end:
-                        member_line += f" (until {end})"
-
-                content += member_line + "\n"
+            parts.append("\n## Members\n")
+            parts.append(''.join(self._format_member_line(member, 'member') for member in mb_members))
 
             # Add Original Members subsection
             if mb_original_members:
-                content += "\n### Original Members\n"
-                for orig_member in mb_original_members:
-                    orig_name = orig_member.get('name', '')
-                    orig_instruments = orig_member.get('instruments', [])
-
-                    sanitized_orig_name = self.sanitize_filename(orig_name)
-                    orig_line = f"- [[{sanitized_orig_name}|{orig_name}]]"
-
-                    if orig_instruments:
-                        orig_line += f" - {', '.join(orig_instruments)}"
-
-                    content += orig_line + "\n"
+                parts.append("\n### Original Members\n")
+                parts.append(''.join(self._format_member_line(member) for member in mb_original_members))
 
         # Add Associated Acts section (for individuals)
         elif mb_associated_acts and entity_type == 'individual':
-            content += "\n## Associated Acts\n"
-            for act in mb_associated_acts:
-                act_name = act.get('name', '')
-                instruments = act.get('instruments', [])
-                begin = act.get('begin', '')
-                end = act.get('end', '')
-
-                # Build associated act line
-                sanitized_act_name = self.sanitize_filename(act_name)
-                act_line = f"- [[{sanitized_act_name}|{act_name}]]"
-
-                # Add instruments/roles
-                if instruments:
-                    act_line += f" - {', '.join(instruments)}"
-
-                # Add time period
-                if begin or end:
-                    if begin and end:
-                        act_line += f" ({begin}–{end})"
-                    elif begin:
-                        act_line += f" ({begin}–present)"
-                    elif end:
-                        act_line += f" (until {end})"
-
-                content += act_line + "\n"
+            parts.append("\n## Associated Acts\n")
+            parts.append(''.join(self._format_member_line(act, 'act') for act in mb_associated_acts))
 
         # Add Musical Connections
         if connections:
-            content += "\n## Musical Connections\n"
-
-            if connections.get('mentors'):
-                content += "\n### Mentors/Influences\n"
-                for mentor in connections['mentors']:
-                    if isinstance(mentor, dict):
-                        name = mentor.get('name', '')
-                        context = mentor.get('context', '')
-                        works = mentor.get('specific_works', '')
-                        period = mentor.get('time_period', '')
-
-                        detail_parts = [context]
-                        if works:
-                            detail_parts.append(f"({works})")
-                        if period:
-                            detail_parts.append(f"[{period}]")
-
-                        # Use proper Obsidian wikilink format: [[Filename|Display Name]]
-                        sanitized_name = self.sanitize_filename(name)
-                        content += f"- [[{sanitized_name}|{name}]] - {' '.join(detail_parts)}\n"
-
-            if connections.get('collaborators'):
-                content += "\n### Key Collaborators\n"
-                for collab in connections['collaborators']:
-                    if isinstance(collab, dict):
-                        name = collab.get('name', '')
-                        context = collab.get('context', '')
-                        works = collab.get('specific_works', '')
-                        period = collab.get('time_period', '')
-
-                        detail_parts = [context]
-                        if works:
-                            detail_parts.append(f"({works})")
-                        if period:
-                            detail_parts.append(f"[{period}]")
-
-                        # Use proper Obsidian wikilink format: [[Filename|Display Name]]
-                        sanitized_name = self.sanitize_filename(name)
-                        content += f"- [[{sanitized_name}|{name}]] - {' '.join(detail_parts)}\n"
-
-            if connections.get('influenced'):
-                content += "\n### Artists Influenced\n"
-                for influenced in connections['influenced']:
-                    if isinstance(influenced, dict):
-                        name = influenced.get('name', '')
-                        context = influenced.get('context', '')
-                        works = influenced.get('specific_works', '')
-                        period = influenced.get('time_period', '')
-
-                        detail_parts = [context]
-                        if works:
-                            detail_parts.append(f"({works})")
-                        if period:
-                            detail_parts.append(f"[{period}]")
-
-                        # Use proper Obsidian wikilink format: [[Filename|Display Name]]
-                        sanitized_name = self.sanitize_filename(name)
-                        content += f"- [[{sanitized_name}|{name}]] - {' '.join(detail_parts)}\n"
+            parts.append("\n## Musical Connections\n")
+
+            for conn_type, heading in (('mentors', 'Mentors/Influences'),
+                                       ('collaborators', 'Key Collaborators'),
+                                       ('influenced', 'Artists Influenced')):
+                if connections.get(conn_type):
+                    parts.append(f"\n### {heading}\n")
+                    parts.append(''.join(
+                        self._format_connection_line(conn)
+                        for conn in connections[conn_type] if isinstance(conn, dict)
+                    ))
 
         # Add external links
-        content += "\n## External Links\n"
+        parts.append("\n## External Links\n")
         if spotify_url:
-            content += f"- [Spotify]({spotify_url})\n"
+            parts.append(f"- [Spotify]({spotify_url})\n")
         if wikipedia_url:
-            content += f"- [Wikipedia]({wikipedia_url})\n"
+            parts.append(f"- [Wikipedia]({wikipedia_url})\n")
         if musicbrainz_data.get('mbid'):
             mb_url = f"https://musicbrainz.org/artist/{musicbrainz_data['mbid']}"
-            content += f"- [MusicBrainz]({mb_url})\n"
+            parts.append(f"- [MusicBrainz]({mb_url})\n")
 
         # Add Tags at the bottom (top 3 genre tags from MusicBrainz)
         if mb_tags:
-            tag_string = ', '.join([f"#{tag.replace(' ', '-').replace('/', '-')}" for tag in mb_tags])
-            content += f"\n---\n**Tags**: {tag_string}\n"
+            tag_string = ', '.join(_tag_slug(tag) for tag in mb_tags)
+            parts.append(f"\n---\n**Tags**: {tag_string}\n")
 
         # Combine frontmatter and content
-        frontmatter_text = yaml.dump(frontmatter, default_flow_style=False, allow_unicode=True)
-        return f"---\n{frontmatter_text}---\n\n{content}"
+        frontmatter_text = _dump_frontmatter(frontmatter)
+        return f"---\n{frontmatter_text}---\n\n{''.join(parts)}"
 
     def write_card(self, card_path: Path, content: str) -> bool:
         """Write artist card to disk."""
@@ -1449,7 +2278,23 @@ Only include verified information from credible sources."""
                 self.logger.info(f"[DRY RUN] Would write card: {card_path}")
                 return True
 
-            card_path.write_text(content, encoding='utf-8')
+            # Encode once: the same bytes are written and sized for the card snapshot
+            data = content.encode('utf-8')
+
+            # Skip rewrites that would only bump the timestamps (e.g. --force over warm API caches),
+            # so mtimes and vault sync stay quiet; a size mismatch rules that out without a read
+            if self._card_sizes.get(card_path.stem) == len(data) and card_path.exists():
+                existing = card_path.read_bytes()
+                if _CARD_TIMESTAMP_RE.sub(b'', existing) == _CARD_TIMESTAMP_RE.sub(b'', data):
+                    self.logger.info(f"Card unchanged, not rewriting: {card_path}")
+                    return True
+
+            # Publish atomically: a crash mid-write leaves the old card (or none), never half of one
+            tmp_path = card_path.with_name(f"{card_path.name}.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, card_path)
+            self._card_sizes[card_path.stem] = len(data)
+            self._index_card(card_path.stem)
             self.logger.info(f"Wrote card: {card_path}")
             return True
 
@@ -1471,20 +2316,28 @@ Only include verified information from credible sources."""
         try:
             self.logger.info(f"Processing: {artist_name}")
 
-            # STEP 1: Find existing card (fuzzy matching catches case variants like "DR. JOHN" vs "dr_john")
+            # STEP 1: Find existing card (normalized matching catches case variants like "DR. JOHN" vs "dr_john")
             exists, card_path, match_type = self.find_existing_card(artist_name)
 
+            if match_type == "fuzzy_variant":
+                # Near-identical name only: report it, but it may well be a different artist
+                self.logger.warning(
+                    f"Possible duplicate for '{artist_name}': similar card {card_path.name} exists "
+                    f"- creating a separate card, review manually"
+                )
+                self._increment_stat('possible_duplicates')
+
             if exists and not self.force:
                 # Case variant found (e.g., "DR._JOHN.md" when looking for "dr_john")
                 if match_type == "case_variant":
                     self.logger.info(f"Found case variant for '{artist_name}': {card_path.name}")
-                    self.stats['skipped_duplicate'] += 1
+                    self._increment_stat('skipped_duplicate')
                     return f"🔍 Duplicate: {card_path.name}"
 
                 # STRICT CHECK: Has Perplexity enhancement? Skip immediately.
                 if self.has_perplexity_enhancement(card_path):
                     self.logger.info(f"Skipping '{artist_name}': Already enhanced with Perplexity")
-                    self.stats['skipped_perplexity'] += 1
+                    self._increment_stat('skipped_perplexity')
                     return "✅ Already enhanced with Perplexity"
 
                 # Card exists but NO Perplexity data - proceed to enhance it
@@ -1494,31 +2347,38 @@ Only include verified information from credible sources."""
             self.logger.info(f"Fetching Spotify metadata for: {artist_name}")
             spotify_data = self.get_spotify_metadata(artist_name)
             if not spotify_data:
-                self.stats['errors'] += 1
+                self._increment_stat('errors')
                 return "❌ Spotify not found"
 
-            time.sleep(SPOTIFY_RATE_LIMIT)
+            # Start the image download now so it overlaps the MusicBrainz/Perplexity calls below
+            image_future = None
+            if spotify_data.get('image_url'):
+                self.logger.info(f"Downloading image for: {artist_name}")
+                image_future = self._image_executor.submit(
+                    self.download_artist_image, spotify_data['image_url'], artist_name
+                )
 
-            # STEP 2: Get MusicBrainz metadata (optional, non-blocking)
+            # STEP 2: Get MusicBrainz metadata (optional, runs on the MusicBrainz worker during STEP 3)
             self.logger.info(f"Fetching MusicBrainz metadata for: {artist_name}")
             spotify_genres = spotify_data.get('genres', [])
-            musicbrainz_data = self.get_musicbrainz_metadata(artist_name, spotify_genres)
-            if musicbrainz_data:
-                self.logger.info(f"MusicBrainz data retrieved for: {artist_name}")
-            else:
-                self.logger.info(f"No MusicBrainz data found for: {artist_name} (continuing with Perplexity only)")
-                musicbrainz_data = {}
-
-            time.sleep(MUSICBRAINZ_RATE_LIMIT)
+            known_mbid = self.get_card_mbid(card_path) if exists and not self.force else None
+            musicbrainz_future = self._musicbrainz_executor.submit(
+                self.get_musicbrainz_metadata, artist_name, spotify_genres, known_mbid
+            )
 
             # STEP 3: Research with Perplexity
             self.logger.info(f"Researching with Perplexity: {artist_name}")
             perplexity_data = self.research_with_perplexity(artist_name, spotify_data)
             if not perplexity_data or not perplexity_data.get('success'):
-                self.stats['errors'] += 1
+                self._increment_stat('errors')
                 return "❌ Perplexity research failed"
 
-            time.sleep(PERPLEXITY_RATE_LIMIT)
+            musicbrainz_data = musicbrainz_future.result()
+            if musicbrainz_data:
+                self.logger.info(f"MusicBrainz data retrieved for: {artist_name}")
+            else:
+                self.logger.info(f"No MusicBrainz data found for: {artist_name} (continuing with Perplexity only)")
+                musicbrainz_data = {}
 
             # STEP 3.5: Merge and deduplicate collaborators from both sources
             perplexity_collaborators = perplexity_data.get('connections', {}).get('collaborators', [])
@@ -1530,11 +2390,8 @@ Only include verified information from credible sources."""
                     perplexity_data['connections'] = {}
                 perplexity_data['connections']['collaborators'] = merged_collaborators
 
-            # STEP 4: Download image
-            self.logger.info(f"Downloading image for: {artist_name}")
-            image_path = None
-            if spotify_data.get('image_url'):
-                image_path = self.download_artist_image(spotify_data['image_url'], artist_name)
+            # STEP 4: Collect the image download started after the Spotify lookup
+            image_path = image_future.result() if image_future else None
 
             if not image_path:
                 self.logger.warning(f"No image downloaded for: {artist_name}")
@@ -1547,45 +2404,41 @@ Only include verified information from credible sources."""
             # STEP 6: Write card
             card_path = self.cards_dir / f"{self.sanitize_filename(artist_name)}.md"
             if not self.write_card(card_path, card_content):
-                self.stats['errors'] += 1
+                self._increment_stat('errors')
                 return "❌ Failed to write card"
 
             # STEP 7: Update connections database
             connections = perplexity_data.get('connections', {})
             if connections:
-                simple_connections = {}
-                for conn_type in ['mentors', 'collaborators', 'influenced']:
-                    if conn_type in connections:
-                        simple_connections[conn_type] = [
-                            conn.get('name', '') for conn in connections[conn_type] if isinstance(conn, dict)
-                        ]
-
-                self.connections_db[artist_name] = {
+                simple_connections = _simple_connections(connections)
+
+                self.connections_db.upsert(artist_name, {
                     **simple_connections,
                     'updated': datetime.now().isoformat(),
                     'source': 'perplexity_research'
-                }
+                })
 
                 connection_count = sum(len(v) for v in simple_connections.values())
-                self.stats['connections_found'] += connection_count
+                self._increment_stat('connections_found', connection_count)
 
             # Update stats
+            connections_found = self._increment_stat('connections_found', 0)
             if exists:
-                self.stats['enhanced'] += 1
-                status_msg = f"✅ Enhanced ({self.stats['connections_found']} connections)"
+                self._increment_stat('enhanced')
+                status_msg = f"✅ Enhanced ({connections_found} connections)"
             else:
-                self.stats['created'] += 1
-                status_msg = f"✨ Created ({self.stats['connections_found']} connections)"
+                self._increment_stat('created')
+                status_msg = f"✨ Created ({connections_found} connections)"
 
             return status_msg
 
         except Exception as e:
             self.logger.error(f"Error processing {artist_name}: {e}")
-            self.stats['errors'] += 1
+            self._increment_stat('errors')
             return f"❌ Error: {str(e)[:50]}"
 
-    def process_archive(self, archive_path: str) -> None:
-        """Process entire WWOZ archive file."""
+    def process_archive(self, archive_path: str, export_connections: bool = False) -> None:
+        """Process entire WWOZ archive file, optionally exporting connections to JSON afterwards."""
         self.logger.info(f"Processing archive: {archive_path}")
 
         # Parse archive
@@ -1596,11 +2449,27 @@ Only include verified information from credible sources."""
 
         self.stats['total'] = len(artists)
 
+        # Collapse repeat plays of the same artist so two workers never race on one card
+        unique_artists = {}
+        for artist in artists:
+            unique_artists.setdefault(self.sanitize_filename(artist), artist)
+        repeats = len(artists) - len(unique_artists)
+        if repeats:
+            self.stats['skipped_duplicate'] += repeats
+            self.stats['processed'] += repeats
+            self.logger.info(f"Skipping {repeats} repeat plays of artists already queued")
+        artists = list(unique_artists.values())
+
         # Authenticate with Spotify
-        if not self.authenticate_spotify():
+        if not self.ensure_spotify_authenticated():
             self.logger.error("Failed to authenticate with Spotify")
             return
 
+        # Refresh already-known Spotify artists in bulk (skips cards that will be skipped anyway)
+        self.prefetch_spotify_metadata([
+            artist for artist in artists if self.force or not self.card_exists(artist)[0]
+        ])
+
         # Initialize Perplexity
         if not self.initialize_perplexity():
             self.logger.error("Failed to initialize Perplexity")
@@ -1609,26 +2478,51 @@ Only include verified information from credible sources."""
         # Process each artist
         print(f"\n🎵 Artist Discovery Pipeline")
         print(f"Archive: {archive_path}")
-        print(f"Found: {len(artists)} artists")
+        print(f"Found: {self.stats['total']} artists ({len(artists)} unique)")
+        print(f"Workers: {self.workers}")
         if self.dry_run:
             print("🔍 DRY RUN MODE - No files will be modified")
         print()
 
-        with tqdm(artists, desc="Processing artists", unit="artist") as pbar:
-            for artist in pbar:
-                pbar.set_description(f"Processing: {artist}")
-
-                status = self.process_artist(artist)
-                pbar.set_postfix_str(status)
-                self.stats['processed'] += 1
-
-                time.sleep(0.1)  # Brief pause
-
-        # Save connections database
-        self._save_connections()
+        with ThreadPoolExecutor(max_workers=self.workers) as executor, \
+                tqdm(total=len(artists), desc="Processing artists", unit="artist") as pbar:
+            # Feed artists in as workers free up rather than queueing the whole archive, so an
+            # interrupt only has to drain a couple of artists per worker
+            queued = iter(artists)
+            pending = {}
+
+            def submit_next() -> None:
+                artist = next(queued, None)
+                if artist is not None:
+                    pending[executor.submit(self.process_artist, artist)] = artist
+
+            for _ in range(self.workers * PENDING_ARTISTS_PER_WORKER):
+                submit_next()
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    artist = pending.pop(future)
+                    submit_next()
+                    status = future.result()
+                    pbar.set_postfix_str(f"{artist[:30]}: {status}")
+                    pbar.update(1)
+                    self._increment_stat('processed')
+
+        # Let any in-flight image downloads and MusicBrainz work finish before reporting
+        self._image_executor.shutdown(wait=True)
+        self._musicbrainz_executor.shutdown(wait=True)
+        self._musicbrainz_followup_executor.shutdown(wait=True)
+        self.api_cache.close()
+
+        # Connections are upserted as each artist finishes; commit the last partial batch
+        self.connections_db.flush()
+        if export_connections:
+            self.export_connections()
 
         # Print summary
         self._print_summary()
+        self.connections_db.close()
 
     def _print_summary(self) -> None:
         """Print processing summary statistics."""
@@ -1637,6 +2531,8 @@ Only include verified information from credible sources."""
         print(f"✅ Enhanced: {self.stats['enhanced']} existing cards")
         print(f"⏭️  Skipped (already has Perplexity): {self.stats['skipped_perplexity']}")
         print(f"🔍 Skipped (duplicate variant found): {self.stats['skipped_duplicate']}")
+        if self.stats['possible_duplicates']:
+            print(f"⚠️  Possible duplicates (similar card name, processed anyway): {self.stats['possible_duplicates']}")
         print(f"🔗 Connections found: {self.stats['connections_found']}")
         print(f"📚 Network size: {len(self.connections_db)} artists")
         print(f"❌ Errors: {self.stats['errors']}")
@@ -1684,6 +2580,28 @@ def main():
         action='store_true',
         help='Re-process and re-enhance already completed artists'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f'Number of artists to process concurrently (default: {DEFAULT_WORKERS})'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Ignore cached Spotify/MusicBrainz/Perplexity responses and refresh them'
+    )
+    parser.add_argument(
+        '--save-every',
+        type=int,
+        default=CONNECTIONS_SAVE_EVERY,
+        help=f'Commit the connections database every N artists (default: {CONNECTIONS_SAVE_EVERY})'
+    )
+    parser.add_argument(
+        '--export-connections',
+        action='store_true',
+        help=f'Also export the connections database to {CONNECTIONS_FILE} after processing'
+    )
     parser.add_argument(
         '--log-level',
         choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
@@ -1716,10 +2634,13 @@ def main():
             cards_dir=args.cards_dir,
             images_dir=args.images_dir,
             dry_run=args.dry_run,
-            force=args.force
+            force=args.force,
+            workers=args.workers,
+            use_cache=not args.no_cache,
+            save_every=args.save_every
         )
 
-        pipeline.process_archive(args.archive)
+        pipeline.process_archive(args.archive, export_connections=args.export_connections)
 
         print("\n✅ Pipeline completed successfully")
 
@@ -14,26 +14,39 @@ It processes cards that don't already have MusicBrainz data and adds:
 - Gender, artist type, disambiguation
 
 Usage:
-    python backfill_musicbrainz_data.py [--dry-run] [--limit N] [--force]
+    python backfill_musicbrainz_data.py [--dry-run] [--limit N] [--force] [--workers N] [--no-cache] [--cache-dir DIR]
 """
 
 import os
 import re
 import sys
-import json
 import time
 import logging
+import hashlib
+import sqlite3
+import functools
+import threading
 import argparse
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Optional, Tuple, Any
 
 import yaml
+import orjson
 import musicbrainzngs
+from rapidfuzz import fuzz, process, utils
 
 # Configuration
 DEFAULT_CARDS_DIR = "/Users/maxwell/LETSGO/MaxVault/01_Projects/PersonalArtistWiki/Artists"
 MUSICBRAINZ_RATE_LIMIT = 1.0  # seconds (required: 1 request/second)
+MUSICBRAINZ_SAFETY_MARGIN = 0.05  # seconds added to the interval so clock jitter never trips a 503
+DEFAULT_WORKERS = 4  # cards processed concurrently; MB requests stay at 1/s, but their round-trips overlap
+DIR_FSYNC_EVERY = 100  # updated cards between fsyncs of the cards directory (persists the renames)
+PRESCAN_MIN_CARDS = 200  # below this, scanning in-process beats starting a process pool
+PRESCAN_CHUNKSIZE = 64  # cards handed to a pre-scan process at a time
+FRONTMATTER_READ_SIZE = 4096  # bytes read at a time when peeking at card frontmatter
+FRONTMATTER_MAX_BYTES = 32768  # give up peeking (and fall back to a full parse) past this
 REQUEST_TIMEOUT = 30
 
 # MusicBrainz Configuration
@@ -41,21 +54,298 @@ MUSICBRAINZ_APP_NAME = "WWOZ-Artist-Backfill"
 MUSICBRAINZ_APP_VERSION = "1.0"
 MUSICBRAINZ_CONTACT = "wwoz-scraper@example.com"
 MUSICBRAINZ_MIN_CONFIDENCE = 80  # Minimum confidence (0-100) to accept a match
+MUSICBRAINZ_NAME_MATCH_MIN_SCORE = 95  # rapidfuzz token_sort_ratio (0-100) for treating a candidate as a name match
+MAX_COLLABORATORS = 20  # Distinct recording collaborators kept per artist
+
+# Response cache (re-runs and retries of low-confidence artists skip the network)
+MB_CACHE_FILE = ".musicbrainz_cache.sqlite"  # stored inside the cards directory unless --cache-dir is given
+MB_CACHE_SEARCH_TTL_DAYS = 7  # search results change as MB gains entries
+MB_CACHE_ARTIST_TTL_DAYS = 30  # artist metadata and recordings are stable
+
+# Cards known to be enriched, by name -> st_mtime_ns; unchanged ones are skipped without being opened
+SCAN_STATE_FILE = ".musicbrainz_backfill_state.json"  # stored inside the cards directory
+
+# Precompiled patterns (filename sanitizing and Quick Info rewrites run per card)
+# Spaces -> underscores, "&" -> "and", filesystem-reserved characters dropped, in one C-level pass
+_FILENAME_TRANSLATION = str.maketrans({' ': '_', '&': 'and', **dict.fromkeys('<>:"/\\|?*')})
+_FILENAME_INVALID_RE = re.compile(r'[^\w\-_.]')
+_TAG_SLUG_TRANSLATION = str.maketrans(' /', '--')
+_QUICK_INFO_RE = re.compile(r'## Quick Info\n(.*?)(?=\n##|\Z)', re.DOTALL)
+_GENRES_LINE_RE = re.compile(r'(- \*\*Genres\*\*:.*\n)')
+_INSTRUMENTS_LINE_RE = re.compile(r'(- \*\*Instruments\*\*:.*\n)')
+_BORN_LINE_RE = re.compile(r'- \*\*Born\*\*:.*\n')
+_WORD_RE = re.compile(r'\w+')
+_ARTICLES = frozenset(('the', 'a', 'an'))
+
+# libyaml's C loader/emitter when PyYAML was built with it (10-20x faster than the pure-Python ones)
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+
+@functools.lru_cache(maxsize=512)
+def _tag_slug(tag: str) -> str:
+    """Render a MusicBrainz tag as an Obsidian hashtag (cached: the same genres recur across cards)."""
+    return '#' + tag.translate(_TAG_SLUG_TRANSLATION)
+
+
+@functools.lru_cache(maxsize=1024)
+def _genre_tokens(genres: Tuple[str, ...]) -> frozenset:
+    """
+    Keyword set for a card's Spotify genres (e.g. "east coast hip hop" -> east, coast, hip, hop).
+
+    Split with the same word tokenizer as _word_tokens, so "r&b" and "afro-cuban" break into
+    the same parts as in a disambiguation. Cached because the same genre lists are scored
+    against every search candidate.
+    """
+    return frozenset(token for genre in genres for token in _WORD_RE.findall(genre.lower()))
+
+
+def _search_key(name: str) -> str:
+    """
+    Normalize an artist name for deduplicating searches.
+
+    Articles and punctuation are dropped, so "The Meters" and "Meters, The" share one search.
+    """
+    return ' '.join(word for word in _WORD_RE.findall(name.lower()) if word not in _ARTICLES)
+
+
+def _word_tokens(text: str) -> frozenset:
+    """Lowercase word set of a disambiguation string, for intersecting with genre keywords."""
+    return frozenset(_WORD_RE.findall(text.lower()))
+
+
+@functools.lru_cache(maxsize=8192)
+def _sanitize_filename(name: str) -> str:
+    """
+    Sanitize artist name for filename.
+
+    Cached because member and associated-act names recur across cards.
+    """
+    sanitized = _FILENAME_INVALID_RE.sub('', name.translate(_FILENAME_TRANSLATION))
+    return sanitized.strip('.')[:200]
+
+
+def _read_card_text(card_path: Path) -> str:
+    """
+    Read a whole card as UTF-8 text with one bytes read and decode instead of a text-mode stream.
+
+    Newlines are normalized the way text mode does ('\\r\\n' and lone '\\r' -> '\\n'), paying for it
+    only on the rare card that has a '\\r'.
+    """
+    text = card_path.read_bytes().decode('utf-8')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def _apply_edits(content: str, edits: List[Tuple[int, int, str]], append: Optional[str] = None) -> str:
+    """
+    Apply non-overlapping (start, end, replacement) edits to content with a single join.
+
+    Edits at the same offset keep their list order. When append is given, trailing whitespace is
+    stripped from the result before it (same as ``result.rstrip() + append``).
+    """
+    parts = []
+    last = 0
+    for start, end, text in sorted(edits, key=lambda edit: edit[0]):
+        parts.append(content[last:start])
+        parts.append(text)
+        last = end
+    parts.append(content[last:])
+
+    if append is not None:
+        while parts and not parts[-1].strip():
+            parts.pop()
+        if parts:
+            parts[-1] = parts[-1].rstrip()
+        parts.append(append)
+
+    return ''.join(parts)
+
+
+# MB-specific fields whose presence means a card was already enriched
+_MB_FIELDS = frozenset(('birth_date', 'death_date', 'gender', 'disambiguation', 'aliases'))
+_MB_PROBE_KEYS = ('musicbrainz_id', *sorted(_MB_FIELDS))  # substrings checked before parsing YAML
+
+
+def _needs_musicbrainz_enrichment(frontmatter: Dict, force: bool) -> bool:
+    """Check if card frontmatter needs MusicBrainz enrichment."""
+    if force:
+        return True
+
+    # Check if already has MusicBrainz ID
+    if frontmatter.get('musicbrainz_id'):
+        return False
+
+    # Check if has any MusicBrainz-specific fields (empty values like `gender: ''` don't count)
+    return not any(frontmatter[field] for field in _MB_FIELDS & frontmatter.keys())
+
+
+def _peek_frontmatter_text(card_path: Path) -> Optional[str]:
+    """
+    Return a card's raw frontmatter, reading just enough of the file to find its closing '---'.
+
+    Returns None when the card has no frontmatter or it is not within the first
+    FRONTMATTER_MAX_BYTES. Opened with O_NOATIME where permitted, so bulk scans don't
+    rewrite access times across the whole vault.
+    """
+    flags = os.O_RDONLY | getattr(os, 'O_NOATIME', 0)
+    try:
+        fd = os.open(card_path, flags)
+    except PermissionError:
+        # O_NOATIME is only allowed for the file's owner
+        fd = os.open(card_path, os.O_RDONLY)
+
+    try:
+        head = b''
+        frontmatter_end = -1
+        while len(head) < FRONTMATTER_MAX_BYTES:
+            chunk = os.read(fd, FRONTMATTER_READ_SIZE)
+            if not chunk:
+                break
+            head += chunk
+            if not head.startswith(b'---'[:len(head)]):
+                return None
+            frontmatter_end = head.find(b'---', 3)
+            if frontmatter_end != -1:
+                break
+    finally:
+        os.close(fd)
+
+    if frontmatter_end == -1:
+        return None
+    return head[3:frontmatter_end].decode('utf-8')
+
+
+def _prescan_card(card_path: Path) -> bool:
+    """
+    Return False when a card already has MusicBrainz data, True otherwise.
+
+    Runs in a pre-scan worker process. Unreadable or malformed cards return True so that
+    process_card reports them exactly as before.
+    """
+    try:
+        frontmatter_text = _peek_frontmatter_text(card_path)
+        # Cheap reject: if no MB field name appears anywhere, the card can't have MB data yet
+        if frontmatter_text is None or not any(key in frontmatter_text for key in _MB_PROBE_KEYS):
+            return True
+        frontmatter = yaml.load(frontmatter_text, Loader=_YAML_LOADER)
+        return not frontmatter or _needs_musicbrainz_enrichment(frontmatter, force=False)
+    except Exception:
+        return True
+
+
+class MusicBrainzCache:
+    """
+    Persistent SQLite cache of raw MusicBrainz responses, keyed by endpoint and lookup.
+
+    Entries older than the `max_age` passed to get() are treated as missing.
+    With `read_enabled=False` values from earlier runs are ignored, but responses stored
+    during this run are still served so a refresh fetches each lookup only once.
+    With `read_only=True` (dry runs) no file is created or modified: an existing cache is
+    opened immutable and responses stored during the run are kept in memory.
+    """
+
+    def __init__(self, path: Path, read_enabled: bool = True, read_only: bool = False):
+        self.read_enabled = read_enabled
+        self.read_only = read_only
+        self._stored_keys = set()  # keys written by this process
+        self._memory: Dict[str, Tuple[int, bytes]] = {}  # rows stored during a read-only run
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+        if not read_only:
+            self._conn = sqlite3.connect(str(path), check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, fetched_at INTEGER NOT NULL, payload BLOB NOT NULL)"
+            )
+            self._conn.commit()
+        elif path.exists():
+            # immutable: read-only without creating -wal/-shm files beside the cache
+            conn = sqlite3.connect(f"{path.as_uri()}?mode=ro&immutable=1", uri=True, check_same_thread=False)
+            if conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'responses'").fetchone():
+                self._conn = conn
+            else:
+                conn.close()
+
+    @staticmethod
+    def _key(endpoint: str, lookup: str) -> str:
+        normalized = lookup.lower().strip()
+        return f"{endpoint}:" + hashlib.blake2b(normalized.encode('utf-8'), digest_size=16).hexdigest()
+
+    def get(self, endpoint: str, lookup: str, max_age: float) -> Optional[Dict]:
+        """Return the cached response, or None when missing, older than max_age seconds, or reads are disabled."""
+        key = self._key(endpoint, lookup)
+        with self._lock:
+            if not self.read_enabled and key not in self._stored_keys:
+                return None
+            row = self._memory.get(key)
+            if row is None and self._conn is not None:
+                row = self._conn.execute(
+                    "SELECT fetched_at, payload FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+        if not row or time.time() - row[0] > max_age:
+            return None
+        return orjson.loads(row[1])
+
+    def set(self, endpoint: str, lookup: str, response: Dict) -> None:
+        """Store a response."""
+        key = self._key(endpoint, lookup)
+        payload = orjson.dumps(response)
+        with self._lock:
+            if self.read_only:
+                self._memory[key] = (int(time.time()), payload)
+            else:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, fetched_at, payload) VALUES (?, ?, ?)",
+                    (key, int(time.time()), payload)
+                )
+                self._conn.commit()
+            self._stored_keys.add(key)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
 
 
 class MusicBrainzBackfiller:
     """Backfill existing artist cards with MusicBrainz metadata."""
 
-    def __init__(self, cards_dir: str, dry_run: bool = False, force: bool = False):
+    def __init__(self, cards_dir: str, dry_run: bool = False, force: bool = False,
+                 workers: int = DEFAULT_WORKERS, use_cache: bool = True,
+                 cache_dir: Optional[str] = None):
         self.cards_dir = Path(cards_dir)
         self.dry_run = dry_run
         self.force = force
+        self.workers = max(1, workers)
 
         if not self.cards_dir.exists():
             raise ValueError(f"Cards directory does not exist: {cards_dir}")
 
         # Initialize MusicBrainz
         musicbrainzngs.set_useragent(MUSICBRAINZ_APP_NAME, MUSICBRAINZ_APP_VERSION, MUSICBRAINZ_CONTACT)
+        # Requests are spaced by _mb_throttle (monotonic clock, only waits out the remainder
+        # of the interval), so musicbrainzngs' own wall-clock limiter is turned off
+        musicbrainzngs.set_rate_limit(False)
+        self._mb_last = 0.0
+        self._mb_lock = threading.Lock()
+
+        # Persistent MB response cache (--no-cache forces a refresh). Dry runs only read the
+        # default cache in the vault; an explicit --cache-dir lies outside it and is still written
+        cache_path = Path(cache_dir) if cache_dir else self.cards_dir
+        if cache_dir:
+            cache_path.mkdir(parents=True, exist_ok=True)
+        self.mb_cache = MusicBrainzCache(cache_path / MB_CACHE_FILE, read_enabled=use_cache,
+                                         read_only=self.dry_run and not cache_dir)
+        # One lock per lookup, so workers asking for the same entity wait for a single fetch
+        self._mb_lookup_locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._mb_lookup_locks_guard = threading.Lock()
+
+        # Enriched-card mtimes carried between runs (see SCAN_STATE_FILE)
+        self.state_file = self.cards_dir / SCAN_STATE_FILE
+        self._enriched_mtimes: Dict[str, int] = {}
 
         # Statistics
         self.stats = {
@@ -66,6 +356,7 @@ class MusicBrainzBackfiller:
             'skipped_no_mb_data': 0,
             'errors': 0
         }
+        self._stats_lock = threading.Lock()
 
         # Setup logging
         self.setup_logging()
@@ -85,13 +376,49 @@ class MusicBrainzBackfiller:
         # Suppress musicbrainzngs verbose logging (uncaught attribute messages)
         logging.getLogger('musicbrainzngs').setLevel(logging.WARNING)
 
+        if _YAML_LOADER is yaml.SafeLoader:
+            self.logger.warning("PyYAML was built without libyaml; falling back to the slower pure-Python YAML loader/dumper")
+
+    def _increment_stat(self, key: str, amount: int = 1) -> int:
+        """Increment a statistics counter from any worker thread and return the new value."""
+        with self._stats_lock:
+            self.stats[key] += amount
+            return self.stats[key]
+
+    def _mb_throttle(self):
+        """Block until the next MusicBrainz request may be sent (call immediately before each request)."""
+        interval = MUSICBRAINZ_RATE_LIMIT + MUSICBRAINZ_SAFETY_MARGIN
+        with self._mb_lock:
+            elapsed = time.monotonic() - self._mb_last
+            if elapsed < interval:
+                time.sleep(interval - elapsed)
+            self._mb_last = time.monotonic()
+
+    def _cached_mb_call(self, endpoint: str, lookup: str, ttl_days: int, fetch, *args, **kwargs) -> Dict:
+        """Return a cached MB response, or fetch (throttled) and cache it."""
+        with self._mb_lookup_locks_guard:
+            lookup_lock = self._mb_lookup_locks.setdefault((endpoint, lookup), threading.Lock())
+
+        with lookup_lock:
+            cached = self.mb_cache.get(endpoint, lookup, max_age=ttl_days * 86400)
+            if cached is not None:
+                return cached
+
+            self._mb_throttle()
+            response = fetch(*args, **kwargs)
+            self.mb_cache.set(endpoint, lookup, response)
+            return response
+
     def get_all_artist_cards(self) -> List[Path]:
-        """Get all artist card markdown files."""
-        cards = list(self.cards_dir.glob("*.md"))
-        # Filter out the connections file
-        cards = [c for c in cards if c.name != "artist_connections.json"]
-        self.logger.info(f"Found {len(cards)} artist cards in {self.cards_dir}")
-        return sorted(cards)
+        """Get all artist card markdown files, sorted so --limit picks a stable subset."""
+        # scandir reports file type from the directory entry, so no per-file stat or glob matching
+        with os.scandir(self.cards_dir) as entries:
+            card_names = sorted(
+                entry.name for entry in entries
+                if entry.name.endswith('.md') and entry.is_file()
+            )
+        self.logger.info(f"Found {len(card_names)} artist cards in {self.cards_dir}")
+        return [self.cards_dir / name for name in card_names]
 
     def parse_card(self, card_path: Path) -> Tuple[Optional[Dict], str]:
         """
@@ -100,8 +427,7 @@ class MusicBrainzBackfiller:
         Returns: (frontmatter_dict, full_content)
         """
         try:
-            with open(card_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = _read_card_text(card_path)
 
             if not content.startswith('---'):
                 self.logger.warning(f"No frontmatter found in {card_path.name}")
@@ -114,7 +440,7 @@ class MusicBrainzBackfiller:
                 return None, content
 
             frontmatter_text = content[3:frontmatter_end]
-            frontmatter = yaml.safe_load(frontmatter_text)
+            frontmatter = yaml.load(frontmatter_text, Loader=_YAML_LOADER)
 
             return frontmatter, content
 
@@ -124,21 +450,79 @@ class MusicBrainzBackfiller:
 
     def needs_musicbrainz_enrichment(self, frontmatter: Dict) -> bool:
         """Check if card needs MusicBrainz enrichment."""
-        if self.force:
-            return True
+        return _needs_musicbrainz_enrichment(frontmatter, self.force)
 
-        # Check if already has MusicBrainz ID
-        if frontmatter.get('musicbrainz_id'):
-            return False
+    def load_scan_state(self) -> Dict[str, int]:
+        """Load the enriched-card mtimes recorded by the previous run (empty if missing or unreadable)."""
+        try:
+            state = orjson.loads(self.state_file.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return {}
+        return state if isinstance(state, dict) else {}
+
+    def save_scan_state(self):
+        """Write the enriched-card mtimes atomically for the next run."""
+        tmp_path = self.state_file.with_name(f"{self.state_file.name}.tmp")
+        try:
+            tmp_path.write_bytes(orjson.dumps(self._enriched_mtimes))
+            os.replace(tmp_path, self.state_file)
+        except OSError as e:
+            self.logger.warning(f"Could not save scan state: {e}")
 
-        # Check if has any MusicBrainz-specific fields
-        mb_fields = ['birth_date', 'death_date', 'gender', 'disambiguation', 'aliases']
-        for field in mb_fields:
-            if frontmatter.get(field):
-                # Already has some MB data
-                return False
+    def _record_enriched(self, card_path: Path, mtime_ns: Optional[int] = None):
+        """Remember that a card has MusicBrainz data as of its current (or given) mtime."""
+        try:
+            if mtime_ns is None:
+                mtime_ns = card_path.stat().st_mtime_ns
+        except OSError:
+            return
+        with self._stats_lock:
+            self._enriched_mtimes[card_path.name] = mtime_ns
+
+    def prescan_cards(self, cards: List[Path]) -> List[Path]:
+        """
+        Drop cards that already have MusicBrainz data before any MB work starts.
 
-        return True
+        Cards recorded as enriched by an earlier run and not modified since are skipped on
+        their mtime alone. The rest are parsed; that is pure CPU, so large card sets are
+        scanned across all cores. Skipped cards are counted as processed/skipped_has_mb.
+        """
+        if self.force:
+            return cards
+
+        unchanged = 0
+        to_scan: List[Tuple[Path, Optional[int]]] = []
+        for card_path in cards:
+            try:
+                mtime_ns = card_path.stat().st_mtime_ns
+            except OSError:
+                mtime_ns = None
+            if mtime_ns is not None and self._enriched_mtimes.get(card_path.name) == mtime_ns:
+                unchanged += 1
+            else:
+                self._enriched_mtimes.pop(card_path.name, None)
+                to_scan.append((card_path, mtime_ns))
+
+        scan_paths = [card_path for card_path, _ in to_scan]
+        if len(scan_paths) >= PRESCAN_MIN_CARDS:
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                needed = list(executor.map(_prescan_card, scan_paths, chunksize=PRESCAN_CHUNKSIZE))
+        else:
+            needed = [_prescan_card(card_path) for card_path in scan_paths]
+
+        pending = []
+        for (card_path, mtime_ns), needs in zip(to_scan, needed):
+            if needs:
+                pending.append(card_path)
+            elif mtime_ns is not None:
+                self._record_enriched(card_path, mtime_ns)
+
+        skipped = len(cards) - len(pending)
+        self._increment_stat('skipped_has_mb', skipped)
+        self._increment_stat('processed', skipped)
+        self.logger.info(f"Pre-scan: {skipped} cards already have MusicBrainz data "
+                         f"({unchanged} unchanged since the last run), {len(pending)} to process")
+        return pending
 
     def calculate_match_confidence(self, artist: Dict[str, Any], search_name: str, spotify_genres: List[str] = None) -> int:
         """
@@ -146,7 +530,8 @@ class MusicBrainzBackfiller:
 
         Scoring breakdown:
         - MusicBrainz search score: 0-40 points (how well MB ranked this result)
-        - Name matching: 0-40 points (exact match = 40, partial = 20)
+        - Name matching: 0-40 points (rapidfuzz token_sort_ratio scaled to 40; ignores case,
+          punctuation and word order, so "Beatles, The" matches "The Beatles")
         - Genre validation: 0-20 points (keyword overlap in disambiguation)
 
         Perfect score (100) = ext:score 100 + exact name + genre match
@@ -166,25 +551,15 @@ class MusicBrainzBackfiller:
         confidence += (mb_score / 100) * 40
 
         # 2. Name matching (0-40 points)
-        artist_name = artist.get('name', '').lower().strip()
-        search_name_norm = search_name.lower().strip()
-
-        if artist_name == search_name_norm:
-            confidence += 40  # Exact match
-        elif artist_name in search_name_norm or search_name_norm in artist_name:
-            confidence += 20  # Partial match
-        else:
-            confidence += 0  # No match
+        name_score = fuzz.token_sort_ratio(artist.get('name', ''), search_name, processor=utils.default_process)
+        confidence += (name_score / 100) * 40
 
         # 3. Genre validation via disambiguation (0-20 points)
         if spotify_genres:
-            disambiguation = artist.get('disambiguation', '').lower()
+            disambiguation = artist.get('disambiguation', '')
             if disambiguation:
-                genre_keywords = set()
-                for genre in spotify_genres:
-                    genre_keywords.update(genre.lower().split())
-
-                matches = sum(1 for keyword in genre_keywords if keyword in disambiguation)
+                genre_keywords = _genre_tokens(tuple(spotify_genres))
+                matches = len(genre_keywords & _word_tokens(disambiguation))
                 if matches > 0:
                     confidence += min(matches * 5, 20)
 
@@ -196,8 +571,8 @@ class MusicBrainzBackfiller:
         Find the best MusicBrainz match for an artist using intelligent matching with confidence scoring.
 
         Matching strategy:
-        1. Prefer exact name matches (case-insensitive)
-        2. If multiple exact matches, use Spotify genres to validate via disambiguation
+        1. Prefer name matches (rapidfuzz token_sort_ratio >= MUSICBRAINZ_NAME_MATCH_MIN_SCORE)
+        2. If multiple name matches, use Spotify genres to validate via disambiguation
         3. Calculate confidence score (0-100) based on name matching + genre overlap
         4. Reject matches below min_confidence threshold
 
@@ -212,41 +587,47 @@ class MusicBrainzBackfiller:
         """
         try:
             # Search for top 10 candidates
-            result = musicbrainzngs.search_artists(artist=artist_name, limit=10)
+            result = self._cached_mb_call(
+                'search', _search_key(artist_name) or artist_name, MB_CACHE_SEARCH_TTL_DAYS,
+                musicbrainzngs.search_artists, artist=artist_name, limit=10
+            )
 
             if not result.get('artist-list'):
                 return None
 
             candidates = result['artist-list']
 
-            # Phase 1: Filter for exact name matches (case-insensitive)
-            normalized_search = artist_name.lower().strip()
-            exact_matches = [
-                artist for artist in candidates
-                if artist.get('name', '').lower().strip() == normalized_search
-            ]
+            # Phase 1: Filter for name matches (case, punctuation and word order insensitive).
+            # Names far off in length can't reach the cutoff, so they aren't scored at all.
+            search_length = len(artist_name)
+            max_length_gap = max(3, search_length // 2)
+            comparable_names = {
+                index: artist.get('name', '') for index, artist in enumerate(candidates)
+                if abs(len(artist.get('name', '')) - search_length) <= max_length_gap
+            }
+            name_matches = process.extract(
+                artist_name, comparable_names,
+                scorer=fuzz.token_sort_ratio, processor=utils.default_process,
+                score_cutoff=MUSICBRAINZ_NAME_MATCH_MIN_SCORE, limit=None
+            )
 
-            if exact_matches:
-                candidates = exact_matches
-                self.logger.debug(f"Found {len(exact_matches)} exact name matches for '{artist_name}'")
+            if name_matches:
+                # Keep MusicBrainz's search ranking among the matches
+                candidates = [candidates[index] for index in sorted(index for _, _, index in name_matches)]
+                self.logger.debug(f"Found {len(name_matches)} name matches for '{artist_name}'")
 
             # Phase 2: If we have multiple candidates and Spotify genres, score by genre relevance
             if len(candidates) > 1 and spotify_genres:
-                genre_keywords = set()
-                for genre in spotify_genres:
-                    # Extract keywords from genre strings (e.g., "east coast hip hop" -> ["east", "coast", "hip", "hop"])
-                    genre_keywords.update(genre.lower().split())
+                genre_keywords = _genre_tokens(tuple(spotify_genres))
 
                 scored_candidates = []
                 for artist in candidates:
                     score = 0
-                    disambiguation = artist.get('disambiguation', '').lower()
+                    disambiguation = artist.get('disambiguation', '')
                     artist_type = artist.get('type', '').lower()
 
-                    # Check for genre keyword overlap in disambiguation
-                    for keyword in genre_keywords:
-                        if keyword in disambiguation:
-                            score += 2  # Strong signal
+                    # Check for genre keyword overlap in disambiguation (2 points each: strong signal)
+                    score += 2 * len(genre_keywords & _word_tokens(disambiguation))
 
                     # Bonus for having disambiguation info (more detailed entry)
                     if disambiguation:
@@ -291,21 +672,30 @@ class MusicBrainzBackfiller:
             self.logger.error(f"Error searching MusicBrainz for '{artist_name}': {e}")
             return None
 
-    def get_musicbrainz_metadata(self, artist_name: str, spotify_genres: List[str] = None) -> Optional[Dict[str, Any]]:
+    def get_musicbrainz_metadata(self, artist_name: str, spotify_genres: List[str] = None,
+                                 frontmatter: Optional[Dict] = None) -> Optional[Dict[str, Any]]:
         """
         Get comprehensive MusicBrainz metadata for an artist.
 
         Args:
             artist_name: Name of artist to search for
             spotify_genres: Optional Spotify genres for better matching
+            frontmatter: Existing card frontmatter; a known musicbrainz_id skips the search and
+                curated collaborators skip the recordings lookup
 
         Returns None if no match found or confidence below threshold
         """
         try:
-            self.logger.info(f"Searching MusicBrainz for: {artist_name}")
+            known_mbid = frontmatter.get('musicbrainz_id') if frontmatter else None
+            if known_mbid:
+                # Already matched on an earlier run (--force refresh): go straight to the lookup
+                self.logger.info(f"Using known MBID for: {artist_name}")
+                match_result = ({'id': known_mbid, 'name': artist_name}, 100)
+            else:
+                self.logger.info(f"Searching MusicBrainz for: {artist_name}")
 
-            # Use improved matching logic with confidence scoring
-            match_result = self.find_best_musicbrainz_match(artist_name, spotify_genres)
+                # Use improved matching logic with confidence scoring
+                match_result = self.find_best_musicbrainz_match(artist_name, spotify_genres)
 
             if not match_result:
                 self.logger.info(f"No confident MusicBrainz match for: {artist_name} (skipping enrichment)")
@@ -325,10 +715,10 @@ class MusicBrainzBackfiller:
                 self.logger.info(f"Found MusicBrainz artist ({confidence}% confidence): {artist.get('name')} (MBID: {mbid})")
 
             # Fetch detailed artist information
-            time.sleep(MUSICBRAINZ_RATE_LIMIT)
-            detailed = musicbrainzngs.get_artist_by_id(
-                mbid,
-                includes=['artist-rels', 'recording-rels', 'aliases', 'tags', 'ratings']
+            includes = ['artist-rels', 'recording-rels', 'aliases', 'tags', 'ratings']
+            detailed = self._cached_mb_call(
+                'artist', f"{mbid}|{','.join(includes)}", MB_CACHE_ARTIST_TTL_DAYS,
+                musicbrainzngs.get_artist_by_id, mbid, includes=includes
             )
 
             artist_data = detailed.get('artist', {})
@@ -361,13 +751,13 @@ class MusicBrainzBackfiller:
             if artist_data.get('begin-area'):
                 metadata['origin'] = artist_data['begin-area'].get('name', '')
 
-            # Extract instruments
-            instruments = []
-            for rel in artist_data.get('artist-relation-list', []):
-                if rel.get('type') == 'member of band':
-                    for attr in rel.get('attribute-list', []):
-                        if attr not in instruments:
-                            instruments.append(attr)
+            # Extract instruments (ordered dedupe across all band memberships)
+            instruments = list(dict.fromkeys(
+                attr
+                for rel in artist_data.get('artist-relation-list', [])
+                if rel.get('type') == 'member of band'
+                for attr in rel.get('attribute-list', [])
+            ))
 
             if instruments:
                 metadata['instruments'] = instruments
@@ -402,8 +792,11 @@ class MusicBrainzBackfiller:
             if original_members:
                 metadata['original_members'] = original_members
 
-            # Extract collaborators
-            collaborators = self.extract_collaborators(mbid)
+            # Extract collaborators (a second MB request, so skipped when the card already lists them)
+            if not self.force and frontmatter and frontmatter.get('collaborators'):
+                collaborators = []
+            else:
+                collaborators = self.extract_collaborators(mbid)
             if collaborators:
                 metadata['collaborators'] = collaborators
 
@@ -475,34 +868,42 @@ class MusicBrainzBackfiller:
             self.logger.error(f"Error parsing member relationships: {e}")
             return [], []
 
+    def _iter_credited_artists(self, recordings: Dict, mbid: str):
+        """Yield each credited artist name (other than mbid itself) once, in recording order."""
+        seen = set()
+        for recording in recordings.get('recording-list', []):
+            for credit in recording.get('artist-credit', []):
+                if isinstance(credit, dict):
+                    artist = credit.get('artist', {})
+                    artist_name = artist.get('name', '')
+                    if artist.get('id') != mbid and artist_name and artist_name not in seen:
+                        seen.add(artist_name)
+                        yield artist_name
+
     def extract_collaborators(self, mbid: str) -> List[str]:
         """Extract collaborators from recordings."""
         try:
-            time.sleep(MUSICBRAINZ_RATE_LIMIT)
-            recordings = musicbrainzngs.browse_recordings(artist=mbid, limit=100)
+            recordings = self._cached_mb_call(
+                'recordings', mbid, MB_CACHE_ARTIST_TTL_DAYS,
+                musicbrainzngs.browse_recordings, artist=mbid, limit=100
+            )
 
-            collaborators = set()
-            for recording in recordings.get('recording-list', []):
-                for credit in recording.get('artist-credit', []):
-                    if isinstance(credit, dict):
-                        artist = credit.get('artist', {})
-                        artist_name = artist.get('name', '')
-                        if artist.get('id') != mbid and artist_name:
-                            collaborators.add(artist_name)
+            # Stop walking the credits as soon as enough distinct names are collected
+            collaborators = []
+            for artist_name in self._iter_credited_artists(recordings, mbid):
+                collaborators.append(artist_name)
+                if len(collaborators) >= MAX_COLLABORATORS:
+                    break
 
-            return sorted(list(collaborators))[:20]
+            return sorted(collaborators)
 
         except Exception as e:
             self.logger.error(f"Error extracting collaborators: {e}")
             return []
 
     def sanitize_filename(self, name: str) -> str:
-        """Sanitize artist name for filename."""
-        sanitized = name.replace(' ', '_')
-        sanitized = re.sub(r'[<>:"/\\|?*]', '', sanitized)
-        sanitized = re.sub(r'[&]', 'and', sanitized)
-        sanitized = re.sub(r'[^\w\-_.]', '', sanitized)
-        return sanitized.strip('.')[:200]
+        """Sanitize artist name for filename (memoized, see _sanitize_filename)."""
+        return _sanitize_filename(name)
 
     def merge_musicbrainz_into_card(self, card_path: Path, frontmatter: Dict,
                                    content: str, mb_data: Dict) -> str:
@@ -547,41 +948,48 @@ class MusicBrainzBackfiller:
                 frontmatter['origin'] = mb_data['origin']
 
         # Update last_updated timestamp
-        frontmatter['last_updated'] = datetime.now().isoformat()
-        frontmatter['musicbrainz_enriched_at'] = datetime.now().isoformat()
-
-        # Parse the existing content sections
-        content_parts = content.split('---', 2)
-        if len(content_parts) < 3:
+        now_iso = datetime.now().isoformat()
+        frontmatter['last_updated'] = now_iso
+        frontmatter['musicbrainz_enriched_at'] = now_iso
+
+        # Locate the markdown body (everything after the closing frontmatter delimiter)
+        frontmatter_start = content.find('---')
+        body_start = content.find('---', frontmatter_start + 3) if frontmatter_start != -1 else -1
+        if body_start == -1:
             self.logger.error(f"Cannot parse content structure for {card_path.name}")
             return content
+        body_start += 3
+        markdown_content = content[body_start:]
 
-        markdown_content = content_parts[2]
-
-        # Update Quick Info section with new fields
-        markdown_content = self.update_quick_info(markdown_content, frontmatter, mb_data)
+        # Collect every section edit against the original body, then assemble the card once
+        # instead of copying the whole document per section
+        edits = self.quick_info_edits(markdown_content, frontmatter, mb_data)
 
-        # Add Members section (for groups) or Associated Acts section (for individuals) if needed
+        # Members section (for groups) or Associated Acts section (for individuals) if needed
+        member_edits = []
         if mb_data.get('members') or mb_data.get('associated_acts'):
-            markdown_content = self.add_members_section(markdown_content, mb_data)
+            member_edits = self.members_section_edits(markdown_content, mb_data)
+        # A new section is a zero-width insert; it ends whatever section precedes it
+        members_pos = next((start for start, end, _ in member_edits if start == end), None)
 
-        # Update External Links section
-        markdown_content = self.update_external_links(markdown_content, mb_data)
+        # Link edits go first so a link closing External Links lands ahead of a section inserted there
+        edits += self.external_links_edits(markdown_content, mb_data, members_pos)
+        edits += member_edits
 
-        # Add Tags section if needed
-        if mb_data.get('tags'):
-            markdown_content = self.add_tags_section(markdown_content, mb_data)
+        tags_section = self.build_tags_section(markdown_content, mb_data) if mb_data.get('tags') else None
 
-        # Rebuild the file
-        frontmatter_text = yaml.dump(frontmatter, default_flow_style=False, allow_unicode=True)
-        return f"---\n{frontmatter_text}---{markdown_content}"
+        # Rebuild the file: new frontmatter replaces everything up to the body
+        frontmatter_text = yaml.dump(frontmatter, Dumper=_YAML_DUMPER, default_flow_style=False, allow_unicode=True)
+        edits = [(body_start + start, body_start + end, text) for start, end, text in edits]
+        edits.append((0, body_start, f"---\n{frontmatter_text}---"))
+        return _apply_edits(content, edits, append=tags_section)
 
-    def update_quick_info(self, content: str, frontmatter: Dict, mb_data: Dict) -> str:
-        """Update Quick Info section with MusicBrainz data."""
+    def quick_info_edits(self, content: str, frontmatter: Dict, mb_data: Dict) -> List[Tuple[int, int, str]]:
+        """Edits updating the Quick Info section with MusicBrainz data."""
         # Find Quick Info section
-        quick_info_match = re.search(r'## Quick Info\n(.*?)(?=\n##|\Z)', content, re.DOTALL)
+        quick_info_match = _QUICK_INFO_RE.search(content)
         if not quick_info_match:
-            return content
+            return []
 
         quick_info = quick_info_match.group(1)
         updated_info = quick_info
@@ -592,39 +1000,23 @@ class MusicBrainzBackfiller:
             if '**Instruments**' not in quick_info:
                 instruments_line = f"- **Instruments**: {', '.join(mb_data['instruments'])}\n"
                 # Insert after Genres line
-                updated_info = re.sub(
-                    r'(- \*\*Genres\*\*:.*\n)',
-                    r'\1' + instruments_line,
-                    updated_info
-                )
+                updated_info = _GENRES_LINE_RE.sub(r'\1' + instruments_line, updated_info)
 
         # Add aliases
         if mb_data.get('aliases') and '**Aliases**' not in quick_info:
             aliases_line = f"- **Aliases**: {', '.join(mb_data['aliases'])}\n"
             # Insert after Instruments or Genres
             if '**Instruments**' in updated_info:
-                updated_info = re.sub(
-                    r'(- \*\*Instruments\*\*:.*\n)',
-                    r'\1' + aliases_line,
-                    updated_info
-                )
+                updated_info = _INSTRUMENTS_LINE_RE.sub(r'\1' + aliases_line, updated_info)
             else:
-                updated_info = re.sub(
-                    r'(- \*\*Genres\*\*:.*\n)',
-                    r'\1' + aliases_line,
-                    updated_info
-                )
+                updated_info = _GENRES_LINE_RE.sub(r'\1' + aliases_line, updated_info)
 
         # Update Born/Origin with dates if available
         if mb_data.get('birth_date'):
             birth_place = frontmatter.get('birth_place', mb_data.get('origin', ''))
             if birth_place:
                 new_born_line = f"- **Born**: {mb_data['birth_date']}, {birth_place}\n"
-                updated_info = re.sub(
-                    r'- \*\*Born\*\*:.*\n',
-                    new_born_line,
-                    updated_info
-                )
+                updated_info = _BORN_LINE_RE.sub(new_born_line, updated_info)
                 # If no Born line exists, add it
                 if '**Born**' not in updated_info:
                     updated_info += new_born_line
@@ -634,30 +1026,38 @@ class MusicBrainzBackfiller:
             died_line = f"- **Died**: {mb_data['death_date']}\n"
             updated_info += died_line
 
-        # Replace in content
-        return content.replace(quick_info, updated_info)
+        if updated_info is quick_info:
+            return []
+
+        # Replace at the section's known offsets instead of searching the document for it again
+        start, end = quick_info_match.span(1)
+        return [(start, end, updated_info)]
 
-    def add_members_section(self, content: str, mb_data: Dict) -> str:
-        """Add or update Members section (for groups) or Associated Acts section (for individuals)."""
+    def members_section_edits(self, content: str, mb_data: Dict) -> List[Tuple[int, int, str]]:
+        """Edits adding or fixing the Members section (for groups) or Associated Acts section (for individuals)."""
         artist_type = mb_data.get('artist_type', '').lower()
 
         # Check if we need to convert "Members" to "Associated Acts" for individuals
         if '## Members' in content and 'person' in artist_type:
             # Individual with wrong "Members" section - needs conversion to "Associated Acts"
-            content = content.replace('## Members', '## Associated Acts')
+            edits = []
+            pos = content.find('## Members')
+            while pos != -1:
+                edits.append((pos, pos + len('## Members'), '## Associated Acts'))
+                pos = content.find('## Members', pos + len('## Members'))
             self.logger.info("Converted '## Members' to '## Associated Acts' for individual artist")
-            return content
+            return edits
 
         # Check if already has correct section
         if ('## Members' in content and 'person' not in artist_type) or '## Associated Acts' in content:
-            return content
+            return []
 
         # Find where to insert (after Fun Facts, before Musical Connections)
         insert_pos = content.find('## Musical Connections')
         if insert_pos == -1:
             insert_pos = content.find('## External Links')
         if insert_pos == -1:
-            return content
+            return []
 
         # Build section for groups (Members)
         if mb_data.get('members') and 'person' not in artist_type:
@@ -697,7 +1097,7 @@ class MusicBrainzBackfiller:
                     section += line + "\n"
 
             # Insert section
-            return content[:insert_pos] + section + "\n" + content[insert_pos:]
+            return [(insert_pos, insert_pos, section + "\n")]
 
         # Build section for individuals (Associated Acts)
         elif mb_data.get('associated_acts') and 'person' in artist_type:
@@ -725,14 +1125,20 @@ class MusicBrainzBackfiller:
                 section += act_line + "\n"
 
             # Insert section
-            return content[:insert_pos] + section + "\n" + content[insert_pos:]
+            return [(insert_pos, insert_pos, section + "\n")]
 
-        return content
+        return []
 
-    def update_external_links(self, content: str, mb_data: Dict) -> str:
-        """Add MusicBrainz link to External Links section."""
+    def external_links_edits(self, content: str, mb_data: Dict,
+                             members_pos: Optional[int] = None) -> List[Tuple[int, int, str]]:
+        """
+        Edits adding the MusicBrainz link to the External Links section.
+
+        members_pos is where a new Members/Associated Acts section is being inserted, which ends
+        the External Links section when it lands inside it.
+        """
         if not mb_data.get('mbid'):
-            return content
+            return []
 
         mb_url = f"https://musicbrainz.org/artist/{mb_data['mbid']}"
         mb_link = f"- [MusicBrainz]({mb_url})\n"
@@ -741,35 +1147,50 @@ class MusicBrainzBackfiller:
         if '## External Links' in content:
             # Check if MusicBrainz already there
             if 'MusicBrainz' in content:
-                return content
+                return []
 
             # Add before the closing or next section
             insert_pos = content.find('## External Links')
-            section_end = content.find('\n## ', insert_pos + 1)
-            if section_end == -1:
-                section_end = content.find('\n---', insert_pos + 1)
-            if section_end == -1:
-                section_end = len(content)
+            if members_pos is not None and members_pos > insert_pos:
+                section_end = content.find('\n## ', insert_pos + 1, members_pos)
+                if section_end == -1:
+                    section_end = members_pos
+            else:
+                section_end = content.find('\n## ', insert_pos + 1)
+                if section_end == -1:
+                    section_end = content.find('\n---', insert_pos + 1)
+                if section_end == -1:
+                    section_end = len(content)
 
             # Insert before section end
-            return content[:section_end] + mb_link + content[section_end:]
+            return [(section_end, section_end, mb_link)]
 
-        return content
+        return []
 
-    def add_tags_section(self, content: str, mb_data: Dict) -> str:
-        """Add Tags section at the bottom."""
+    def build_tags_section(self, content: str, mb_data: Dict) -> Optional[str]:
+        """Tags section to append at the bottom (None if the card already has one)."""
         if '**Tags**:' in content:
-            return content  # Already has tags
+            return None  # Already has tags
 
         tags = mb_data.get('tags', [])
         if not tags:
-            return content
+            return None
 
-        tag_string = ', '.join([f"#{tag.replace(' ', '-').replace('/', '-')}" for tag in tags])
-        tags_section = f"\n---\n**Tags**: {tag_string}\n"
+        tag_string = ', '.join(_tag_slug(tag) for tag in tags)
+        return f"\n---\n**Tags**: {tag_string}\n"
 
-        # Add at the very end
-        return content.rstrip() + tags_section
+    def _sync_cards_dir(self):
+        """fsync the cards directory so completed renames survive a crash (no-op where unsupported)."""
+        try:
+            dir_fd = os.open(self.cards_dir, os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0))
+        except OSError:
+            return
+        try:
+            os.fsync(dir_fd)
+        except OSError as e:
+            self.logger.debug(f"Could not fsync {self.cards_dir}: {e}")
+        finally:
+            os.close(dir_fd)
 
     def process_card(self, card_path: Path) -> str:
         """Process a single artist card."""
@@ -779,12 +1200,12 @@ class MusicBrainzBackfiller:
             # Parse card
             frontmatter, content = self.parse_card(card_path)
             if not frontmatter:
-                self.stats['errors'] += 1
+                self._increment_stat('errors')
                 return "❌ Parse error"
 
             # Check if needs enrichment
             if not self.needs_musicbrainz_enrichment(frontmatter):
-                self.stats['skipped_has_mb'] += 1
+                self._increment_stat('skipped_has_mb')
                 return "⏭️  Already has MB data"
 
             # Get artist name and genres (for better matching)
@@ -792,30 +1213,31 @@ class MusicBrainzBackfiller:
             spotify_genres = frontmatter.get('genres', [])
 
             # Get MusicBrainz data
-            mb_data = self.get_musicbrainz_metadata(artist_name, spotify_genres)
+            mb_data = self.get_musicbrainz_metadata(artist_name, spotify_genres, frontmatter)
             if not mb_data:
-                self.stats['skipped_no_mb_data'] += 1
+                self._increment_stat('skipped_no_mb_data')
                 return "⚠️  No MB data found"
 
-            time.sleep(MUSICBRAINZ_RATE_LIMIT)
-
             # Merge data into card
             updated_content = self.merge_musicbrainz_into_card(card_path, frontmatter, content, mb_data)
 
-            # Write updated card
+            # Write updated card atomically: an interrupted run leaves the old card, never half of one
             if not self.dry_run:
-                with open(card_path, 'w', encoding='utf-8') as f:
-                    f.write(updated_content)
+                tmp_path = card_path.with_name(f"{card_path.name}.tmp")
+                tmp_path.write_bytes(updated_content.encode('utf-8'))
+                os.replace(tmp_path, card_path)
+                self._record_enriched(card_path)
                 self.logger.info(f"Updated: {card_path.name}")
             else:
                 self.logger.info(f"[DRY RUN] Would update: {card_path.name}")
 
-            self.stats['updated'] += 1
+            if self._increment_stat('updated') % DIR_FSYNC_EVERY == 0 and not self.dry_run:
+                self._sync_cards_dir()
             return "✅ Updated"
 
         except Exception as e:
             self.logger.error(f"Error processing {card_path.name}: {e}")
-            self.stats['errors'] += 1
+            self._increment_stat('errors')
             return f"❌ Error: {str(e)[:30]}"
 
     def run(self, limit: Optional[int] = None):
@@ -831,6 +1253,7 @@ class MusicBrainzBackfiller:
         print(f"Cards directory: {self.cards_dir}")
         print(f"Total cards: {self.stats['total']}")
         print(f"Processing: {len(cards)} cards")
+        print(f"Workers: {self.workers}")
         if self.dry_run:
             print("🔍 DRY RUN MODE - No files will be modified")
         if self.force:
@@ -839,15 +1262,24 @@ class MusicBrainzBackfiller:
 
         from tqdm import tqdm
 
-        with tqdm(cards, desc="Processing cards", unit="card") as pbar:
-            for card_path in pbar:
-                pbar.set_description(f"Processing: {card_path.stem[:30]}")
-
-                status = self.process_card(card_path)
-                pbar.set_postfix_str(status)
-                self.stats['processed'] += 1
-
-                time.sleep(0.1)
+        self._enriched_mtimes = self.load_scan_state()
+        cards = self.prescan_cards(cards)
+
+        # Workers overlap card parsing/writing and MB round-trips; _mb_throttle (shared
+        # lock) keeps the request rate at 1/s across all of them
+        with ThreadPoolExecutor(max_workers=self.workers) as executor, \
+                tqdm(total=len(cards), desc="Processing cards", unit="card") as pbar:
+            futures = {executor.submit(self.process_card, card_path): card_path for card_path in cards}
+            for future in as_completed(futures):
+                status = future.result()
+                pbar.set_postfix_str(f"{futures[future].stem[:30]}: {status}")
+                pbar.update(1)
+                self._increment_stat('processed')
+
+        if not self.dry_run:
+            self._sync_cards_dir()
+            self.save_scan_state()
+        self.mb_cache.close()
 
         # Print summary
         self.print_summary()
@@ -892,6 +1324,21 @@ def main():
         type=int,
         help='Limit processing to first N cards (for testing)'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f'Number of cards to process concurrently (default: {DEFAULT_WORKERS})'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Ignore cached MusicBrainz responses and refresh them'
+    )
+    parser.add_argument(
+        '--cache-dir',
+        help='Directory for the MusicBrainz response cache (default: the cards directory)'
+    )
     parser.add_argument(
         '--log-level',
         choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
@@ -910,7 +1357,10 @@ def main():
         backfiller = MusicBrainzBackfiller(
             cards_dir=args.cards_dir,
             dry_run=args.dry_run,
-            force=args.force
+            force=args.force,
+            workers=args.workers,
+            use_cache=not args.no_cache,
+            cache_dir=args.cache_dir
         )
 
         backfiller.run(limit=args.limit)
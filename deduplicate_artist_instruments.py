@@ -8,31 +8,62 @@ due to the operator precedence bug in artist_discovery_pipeline.py.
 It processes all artist cards and:
 - Deduplicates instruments list while preserving order
 - Updates frontmatter
+- Brings stale Quick Info instrument lines in line with the frontmatter (the fix
+  fix_quick_info_instruments.py applies, done in the same pass)
 - Generates a summary report
 
 Usage:
-    python deduplicate_artist_instruments.py [--dry-run] [--cards-dir PATH]
+    python deduplicate_artist_instruments.py [--dry-run] [--cards-dir PATH] [--workers N]
 """
 
 import os
+import re
 import sys
 import yaml
 import argparse
+import functools
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional
+from typing import Callable, List, Dict, Tuple, Optional
 from collections import OrderedDict
 
 
 DEFAULT_CARDS_DIR = "/Users/maxwell/LETSGO/MaxVault/01_Projects/PersonalArtistWiki/Artists"
+DEFAULT_WORKERS = os.cpu_count() or 1  # worker processes (YAML parsing is CPU-bound, so threads would share one core)
+WORKER_CHUNKSIZE = 16  # cards sent to a worker process per round-trip
+
+FRONTMATTER_READ_SIZE = 4096  # characters read at a time while looking for the closing '---'
+
+# Frontmatter key probed for before parsing: cards without it can't need changes
+_INSTRUMENTS_KEY = 'instruments'
+
+# Matches: - **Instruments**: [any text until newline]
+_INSTRUMENTS_LINE_PREFIX = '- **Instruments**:'
+_INSTRUMENTS_LINE_RE = re.compile(r'(- \*\*Instruments\*\*:).*')
+
+# libyaml's C loader/emitter when PyYAML was built with it (10-20x faster than the pure-Python ones)
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+
+def _read_body(card_path: Path, offset: int) -> str:
+    """Read a card's markdown after the frontmatter (offset = index just past the closing '---')."""
+    # One bytes read and decode instead of a text-mode stream; newlines are normalized the way
+    # text mode does (the offset comes from a text-mode read), paying for it only when there's a '\r'
+    text = card_path.read_bytes().decode('utf-8')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text[offset:]
 
 
 class InstrumentDeduplicator:
     """Deduplicate instruments in artist card frontmatter."""
 
-    def __init__(self, cards_dir: str, dry_run: bool = False):
+    def __init__(self, cards_dir: str, dry_run: bool = False, workers: int = DEFAULT_WORKERS):
         self.cards_dir = Path(cards_dir)
         self.dry_run = dry_run
+        self.workers = max(1, workers)
 
         if not self.cards_dir.exists():
             raise ValueError(f"Cards directory does not exist: {cards_dir}")
@@ -43,6 +74,7 @@ class InstrumentDeduplicator:
             'cards_with_duplicates': 0,
             'cards_fixed': 0,
             'total_duplicates_removed': 0,
+            'quick_info_fixed': 0,
             'errors': 0
         }
 
@@ -64,43 +96,61 @@ class InstrumentDeduplicator:
         )
         self.logger = logging.getLogger(__name__)
 
+        if _YAML_LOADER is yaml.SafeLoader:
+            self.logger.warning("PyYAML was built without libyaml; falling back to the slower pure-Python YAML loader/dumper")
+
     def get_all_artist_cards(self) -> List[Path]:
-        """Get all artist card markdown files."""
-        cards = list(self.cards_dir.glob("*.md"))
-        # Filter out non-artist files
-        cards = [c for c in cards if c.name != "artist_connections.json"]
-        self.logger.info(f"Found {len(cards)} artist cards in {self.cards_dir}")
-        return sorted(cards)
-
-    def parse_card(self, card_path: Path) -> Tuple[Optional[Dict], str, str]:
+        """Get all artist card markdown files, sorted."""
+        # scandir reports file type from the directory entry, so no per-file stat or glob matching
+        with os.scandir(self.cards_dir) as entries:
+            card_names = sorted(
+                entry.name for entry in entries
+                if entry.name.endswith('.md') and entry.is_file()
+            )
+        self.logger.info(f"Found {len(card_names)} artist cards in {self.cards_dir}")
+        return [self.cards_dir / name for name in card_names]
+
+    def parse_card(self, card_path: Path, probe: Optional[str] = None) -> Tuple[Optional[Dict], str, Callable[[], str]]:
         """
-        Parse artist card and extract frontmatter and content.
+        Parse artist card frontmatter, reading the file only as far as its closing '---'.
 
-        Returns: (frontmatter_dict, frontmatter_text, body_content)
+        When `probe` is given and doesn't occur anywhere in the frontmatter text, the YAML
+        isn't parsed at all and an empty dict is returned (cheap reject for the common case).
+
+        Returns: (frontmatter_dict, frontmatter_text, read_body), where read_body() loads the
+        markdown after the frontmatter on demand (most cards are skipped without needing it)
         """
         try:
             with open(card_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            if not content.startswith('---'):
-                self.logger.warning(f"No frontmatter found in {card_path.name}")
-                return None, "", content
+                head = f.read(FRONTMATTER_READ_SIZE)
+                if not head.startswith('---'):
+                    self.logger.warning(f"No frontmatter found in {card_path.name}")
+                    return None, "", functools.partial(_read_body, card_path, 0)
+
+                # Find frontmatter boundaries
+                frontmatter_end = head.find('---', 3)
+                while frontmatter_end == -1:
+                    chunk = f.read(FRONTMATTER_READ_SIZE)
+                    if not chunk:
+                        break
+                    head += chunk
+                    frontmatter_end = head.find('---', 3)
 
-            # Find frontmatter boundaries
-            frontmatter_end = content.find('---', 3)
             if frontmatter_end == -1:
                 self.logger.warning(f"Malformed frontmatter in {card_path.name}")
-                return None, "", content
+                return None, "", functools.partial(_read_body, card_path, 0)
 
-            frontmatter_text = content[3:frontmatter_end]
-            body_content = content[frontmatter_end + 3:]
-            frontmatter = yaml.safe_load(frontmatter_text)
+            frontmatter_text = head[3:frontmatter_end]
+            read_body = functools.partial(_read_body, card_path, frontmatter_end + 3)
+            if probe and probe not in frontmatter_text:
+                return {}, frontmatter_text, read_body
+            frontmatter = yaml.load(frontmatter_text, Loader=_YAML_LOADER)
 
-            return frontmatter, frontmatter_text, body_content
+            return frontmatter, frontmatter_text, read_body
 
         except Exception as e:
             self.logger.error(f"Error parsing {card_path.name}: {e}")
-            return None, "", ""
+            return None, "", lambda: ""
 
     def deduplicate_list(self, items: List[str]) -> Tuple[List[str], int]:
         """
@@ -108,27 +158,19 @@ class InstrumentDeduplicator:
 
         Returns: (deduplicated_list, number_of_duplicates_removed)
         """
-        seen = set()
-        result = []
-        duplicates = 0
-
-        for item in items:
-            if item not in seen:
-                seen.add(item)
-                result.append(item)
-            else:
-                duplicates += 1
-
-        return result, duplicates
+        # dict keys keep first-seen order, so this dedupes in one C-level pass
+        result = list(dict.fromkeys(items))
+        return result, len(items) - len(result)
 
     def has_duplicate_instruments(self, frontmatter: Dict) -> bool:
         """Check if frontmatter has duplicate instruments."""
         instruments = frontmatter.get('instruments')
-        if not instruments or not isinstance(instruments, list):
+        if not isinstance(instruments, list):
             return False
 
-        # Check for duplicates
-        return len(instruments) != len(set(instruments))
+        # Empty and single-instrument lists (most cards) can't have duplicates: skip the set
+        count = len(instruments)
+        return count > 1 and count != len(set(instruments))
 
     def fix_quick_info_instruments(self, content: str, deduplicated_instruments: List[str]) -> str:
         """
@@ -136,35 +178,49 @@ class InstrumentDeduplicator:
 
         Replaces duplicate instrument lists with the deduplicated version.
         """
-        import re
-
-        # Find the Instruments line in Quick Info section
-        # Pattern matches: - **Instruments**: [any text until newline]
-        pattern = r'(- \*\*Instruments\*\*:).*'
-
         # Build the replacement instruments line
         instruments_str = ', '.join(deduplicated_instruments)
         replacement = rf'\1 {instruments_str}'
 
         # Replace the line
-        updated_content = re.sub(pattern, replacement, content)
+        updated_content = _INSTRUMENTS_LINE_RE.sub(replacement, content)
 
         return updated_content
 
-    def process_card(self, card_path: Path) -> str:
-        """Process a single artist card."""
+    def quick_info_matches(self, content: str, instruments: List[str]) -> bool:
+        """
+        Check whether the first Instruments line in Quick Info already lists exactly these instruments.
+
+        Cards without an Instruments line count as matching (there's nothing to fix).
+        """
+        line_start = content.find(_INSTRUMENTS_LINE_PREFIX)
+        if line_start == -1:
+            return True
+        expected_line = f"{_INSTRUMENTS_LINE_PREFIX} {', '.join(instruments)}"
+        line_end = line_start + len(expected_line)
+        return content.startswith(expected_line, line_start) and (line_end == len(content) or content[line_end] == '\n')
+
+    def process_card(self, card_path: Path) -> Tuple[str, Dict[str, int], Optional[Dict]]:
+        """
+        Process a single artist card.
+
+        Runs in a worker process, so it doesn't touch self.stats/self.report; run() applies the result.
+
+        Returns: (status, stats_delta, report_entry_or_None)
+        """
         try:
             self.logger.info(f"Processing: {card_path.name}")
 
             # Parse card
-            frontmatter, frontmatter_text, body_content = self.parse_card(card_path)
-            if not frontmatter:
-                self.stats['errors'] += 1
-                return "❌ Parse error"
+            frontmatter, frontmatter_text, read_body = self.parse_card(card_path, probe=_INSTRUMENTS_KEY)
+            if frontmatter is None:
+                return "❌ Parse error", {'errors': 1}, None
 
             # Check if has duplicate instruments
             if not self.has_duplicate_instruments(frontmatter):
-                return "✓ No duplicates"
+                # Same pass: Quick Info can still disagree with an already-clean frontmatter list
+                status, stats_delta = self.fix_stale_quick_info(card_path, frontmatter, frontmatter_text, read_body)
+                return status, stats_delta, None
 
             # Get instruments
             instruments = frontmatter['instruments']
@@ -179,47 +235,79 @@ class InstrumentDeduplicator:
                 f"(removed {duplicates_removed} duplicates)"
             )
 
-            # Update statistics
-            self.stats['cards_with_duplicates'] += 1
-            self.stats['total_duplicates_removed'] += duplicates_removed
-
-            # Add to report
-            self.report.append({
+            # Statistics and report entry
+            stats_delta = {
+                'cards_with_duplicates': 1,
+                'total_duplicates_removed': duplicates_removed
+            }
+            report_entry = {
                 'file': card_path.name,
                 'artist': frontmatter.get('title', card_path.stem),
                 'original_count': original_count,
                 'deduplicated_count': deduplicated_count,
                 'duplicates_removed': duplicates_removed,
                 'instruments': deduplicated
-            })
+            }
 
             if self.dry_run:
                 self.logger.info(f"  [DRY RUN] Would update: {card_path.name}")
-                return f"🔍 Would fix ({duplicates_removed} duplicates)"
+                return f"🔍 Would fix ({duplicates_removed} duplicates)", stats_delta, report_entry
 
             # Update frontmatter
             frontmatter['instruments'] = deduplicated
 
             # Fix the Quick Info section in the markdown body
-            body_content = self.fix_quick_info_instruments(body_content, deduplicated)
+            body_content = self.fix_quick_info_instruments(read_body(), deduplicated)
 
             # Rebuild the file
-            frontmatter_yaml = yaml.dump(frontmatter, default_flow_style=False, allow_unicode=True, sort_keys=False)
+            frontmatter_yaml = yaml.dump(frontmatter, Dumper=_YAML_DUMPER, default_flow_style=False, allow_unicode=True, sort_keys=False)
             updated_content = f"---\n{frontmatter_yaml}---{body_content}"
 
-            # Write updated card
-            with open(card_path, 'w', encoding='utf-8') as f:
-                f.write(updated_content)
+            # Write updated card atomically: an interrupted run leaves the old card, never half of one
+            tmp_path = card_path.with_name(f"{card_path.name}.tmp")
+            tmp_path.write_bytes(updated_content.encode('utf-8'))
+            os.replace(tmp_path, card_path)
 
-            self.stats['cards_fixed'] += 1
+            stats_delta['cards_fixed'] = 1
             self.logger.info(f"  ✅ Updated: {card_path.name}")
 
-            return f"✅ Fixed ({duplicates_removed} duplicates removed)"
+            return f"✅ Fixed ({duplicates_removed} duplicates removed)", stats_delta, report_entry
 
         except Exception as e:
             self.logger.error(f"Error processing {card_path.name}: {e}")
-            self.stats['errors'] += 1
-            return f"❌ Error: {str(e)[:30]}"
+            return f"❌ Error: {str(e)[:30]}", {'errors': 1}, None
+
+    def fix_stale_quick_info(self, card_path: Path, frontmatter: Dict, frontmatter_text: str,
+                             read_body: Callable[[], str]) -> Tuple[str, Dict[str, int]]:
+        """
+        Rewrite the Quick Info instruments of a card whose frontmatter has no duplicates.
+
+        Returns: (status, stats_delta)
+        """
+        instruments = frontmatter.get('instruments')
+        if not instruments or not isinstance(instruments, list):
+            return "✓ No duplicates", {}
+
+        body_content = read_body()
+        if self.quick_info_matches(body_content, instruments):
+            return "✓ No duplicates", {}
+
+        if self.dry_run:
+            self.logger.info(f"  [DRY RUN] Would update Quick Info in: {card_path.name}")
+            return "🔍 Would fix Quick Info", {}
+
+        # Rebuild the file around the untouched frontmatter text: only the Instruments line
+        # changed, so re-dumping the YAML would just risk reformatting unrelated keys
+        body_content = self.fix_quick_info_instruments(body_content, instruments)
+        updated_content = f"---{frontmatter_text}---{body_content}"
+
+        # Write updated card atomically: an interrupted run leaves the old card, never half of one
+        tmp_path = card_path.with_name(f"{card_path.name}.tmp")
+        tmp_path.write_bytes(updated_content.encode('utf-8'))
+        os.replace(tmp_path, card_path)
+
+        self.logger.info(f"  ✅ Fixed Quick Info: {card_path.name}")
+        return "✅ Quick Info fixed", {'quick_info_fixed': 1}
 
     def run(self):
         """Run the deduplication process."""
@@ -235,12 +323,19 @@ class InstrumentDeduplicator:
 
         from tqdm import tqdm
 
-        with tqdm(cards, desc="Processing cards", unit="card") as pbar:
-            for card_path in pbar:
+        # Worker processes read/parse/write cards in parallel; results come back in card order
+        # and are applied here, so stats and the report need no locking
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                 initargs=(str(self.cards_dir), self.dry_run)) as executor, \
+                tqdm(total=len(cards), desc="Processing cards", unit="card") as pbar:
+            for card_path, (status, stats_delta, report_entry) in zip(cards, executor.map(_process_card_in_worker, cards, chunksize=WORKER_CHUNKSIZE)):
                 pbar.set_description(f"Processing: {card_path.stem[:30]}")
-
-                status = self.process_card(card_path)
+                for key, amount in stats_delta.items():
+                    self.stats[key] += amount
+                if report_entry:
+                    self.report.append(report_entry)
                 pbar.set_postfix_str(status)
+                pbar.update(1)
 
         # Print summary
         self.print_summary()
@@ -255,6 +350,7 @@ class InstrumentDeduplicator:
         print(f"✅ Cards fixed: {self.stats['cards_fixed']}")
         print(f"🔍 Cards with duplicates found: {self.stats['cards_with_duplicates']}")
         print(f"📉 Total duplicates removed: {self.stats['total_duplicates_removed']}")
+        print(f"📋 Quick Info lines fixed (no duplicates): {self.stats['quick_info_fixed']}")
         print(f"❌ Errors: {self.stats['errors']}")
         print(f"📁 Total cards processed: {self.stats['total_cards']}")
 
@@ -282,6 +378,20 @@ class InstrumentDeduplicator:
             print(f"\n... and {len(sorted_report) - 20} more cards with duplicates")
 
 
+_worker: Optional[InstrumentDeduplicator] = None  # per-process instance used by the pool workers
+
+
+def _init_worker(cards_dir: str, dry_run: bool):
+    """Pool initializer: build this process's own InstrumentDeduplicator."""
+    global _worker
+    _worker = InstrumentDeduplicator(cards_dir, dry_run=dry_run)
+
+
+def _process_card_in_worker(card_path: Path):
+    """Pool task: process one card with this process's instance."""
+    return _worker.process_card(card_path)
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -298,6 +408,12 @@ def main():
         action='store_true',
         help='Preview changes without modifying files'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f'Number of worker processes (default: {DEFAULT_WORKERS})'
+    )
     parser.add_argument(
         '--log-level',
         choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
@@ -315,7 +431,8 @@ def main():
         # Create deduplicator and run
         deduplicator = InstrumentDeduplicator(
             cards_dir=args.cards_dir,
-            dry_run=args.dry_run
+            dry_run=args.dry_run,
+            workers=args.workers
         )
 
         deduplicator.run()
@@ -3,31 +3,60 @@
 Fix Quick Info Instrument Display
 
 This script updates the Quick Info section in artist cards to match the corrected
-frontmatter instruments list. Run this after deduplicate_artist_instruments.py.
+frontmatter instruments list. deduplicate_artist_instruments.py now applies the same
+fix in its own pass, so this is only needed on its own (e.g. after hand-editing
+frontmatter instruments).
 
 Usage:
-    python fix_quick_info_instruments.py [--dry-run]
+    python fix_quick_info_instruments.py [--dry-run] [--workers N]
 """
 
 import os
 import sys
 import yaml
 import argparse
+import functools
 import logging
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional
+from typing import Callable, List, Dict, Tuple, Optional
 
 
 DEFAULT_CARDS_DIR = "/Users/maxwell/LETSGO/MaxVault/01_Projects/PersonalArtistWiki/Artists"
+DEFAULT_WORKERS = os.cpu_count() or 1  # worker processes (YAML parsing is CPU-bound, so threads would share one core)
+WORKER_CHUNKSIZE = 16  # cards sent to a worker process per round-trip
+
+FRONTMATTER_READ_SIZE = 4096  # characters read at a time while looking for the closing '---'
+
+# Frontmatter key probed for before parsing: cards without it can't need changes
+_INSTRUMENTS_KEY = 'instruments'
+
+# Matches: - **Instruments**: [any text until newline]
+_INSTRUMENTS_LINE_PREFIX = '- **Instruments**:'
+_INSTRUMENTS_LINE_RE = re.compile(r'(- \*\*Instruments\*\*:).*')
+
+# libyaml's C loader when PyYAML was built with it (10-20x faster than the pure-Python one)
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+def _read_body(card_path: Path, offset: int) -> str:
+    """Read a card's markdown after the frontmatter (offset = index just past the closing '---')."""
+    # One bytes read and decode instead of a text-mode stream; newlines are normalized the way
+    # text mode does (the offset comes from a text-mode read), paying for it only when there's a '\r'
+    text = card_path.read_bytes().decode('utf-8')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text[offset:]
 
 
 class QuickInfoFixer:
     """Fix Quick Info instruments section to match frontmatter."""
 
-    def __init__(self, cards_dir: str, dry_run: bool = False):
+    def __init__(self, cards_dir: str, dry_run: bool = False, workers: int = DEFAULT_WORKERS):
         self.cards_dir = Path(cards_dir)
         self.dry_run = dry_run
+        self.workers = max(1, workers)
 
         if not self.cards_dir.exists():
             raise ValueError(f"Cards directory does not exist: {cards_dir}")
@@ -56,39 +85,59 @@ class QuickInfoFixer:
         )
         self.logger = logging.getLogger(__name__)
 
-    def get_all_artist_cards(self) -> List[Path]:
-        """Get all artist card markdown files."""
-        cards = list(self.cards_dir.glob("*.md"))
-        cards = [c for c in cards if c.name != "artist_connections.json"]
-        self.logger.info(f"Found {len(cards)} artist cards in {self.cards_dir}")
-        return sorted(cards)
+        if _YAML_LOADER is yaml.SafeLoader:
+            self.logger.warning("PyYAML was built without libyaml; falling back to the slower pure-Python YAML loader")
 
-    def parse_card(self, card_path: Path) -> Tuple[Optional[Dict], str, str]:
+    def get_all_artist_cards(self) -> List[Path]:
+        """Get all artist card markdown files, sorted."""
+        # scandir reports file type from the directory entry, so no per-file stat or glob matching
+        with os.scandir(self.cards_dir) as entries:
+            card_names = sorted(
+                entry.name for entry in entries
+                if entry.name.endswith('.md') and entry.is_file()
+            )
+        self.logger.info(f"Found {len(card_names)} artist cards in {self.cards_dir}")
+        return [self.cards_dir / name for name in card_names]
+
+    def parse_card(self, card_path: Path, probe: Optional[str] = None) -> Tuple[Optional[Dict], str, Callable[[], str]]:
         """
-        Parse artist card and extract frontmatter and content.
+        Parse artist card frontmatter, reading the file only as far as its closing '---'.
+
+        When `probe` is given and doesn't occur anywhere in the frontmatter text, the YAML
+        isn't parsed at all and an empty dict is returned (cheap reject for the common case).
 
-        Returns: (frontmatter_dict, frontmatter_text, body_content)
+        Returns: (frontmatter_dict, frontmatter_text, read_body), where read_body() loads the
+        markdown after the frontmatter on demand (most cards are skipped without needing it)
         """
         try:
             with open(card_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            if not content.startswith('---'):
-                return None, "", content
+                head = f.read(FRONTMATTER_READ_SIZE)
+                if not head.startswith('---'):
+                    return None, "", functools.partial(_read_body, card_path, 0)
+
+                # Find frontmatter boundaries
+                frontmatter_end = head.find('---', 3)
+                while frontmatter_end == -1:
+                    chunk = f.read(FRONTMATTER_READ_SIZE)
+                    if not chunk:
+                        break
+                    head += chunk
+                    frontmatter_end = head.find('---', 3)
 
-            frontmatter_end = content.find('---', 3)
             if frontmatter_end == -1:
-                return None, "", content
+                return None, "", functools.partial(_read_body, card_path, 0)
 
-            frontmatter_text = content[3:frontmatter_end]
-            body_content = content[frontmatter_end + 3:]
-            frontmatter = yaml.safe_load(frontmatter_text)
+            frontmatter_text = head[3:frontmatter_end]
+            read_body = functools.partial(_read_body, card_path, frontmatter_end + 3)
+            if probe and probe not in frontmatter_text:
+                return {}, frontmatter_text, read_body
+            frontmatter = yaml.load(frontmatter_text, Loader=_YAML_LOADER)
 
-            return frontmatter, frontmatter_text, body_content
+            return frontmatter, frontmatter_text, read_body
 
         except Exception as e:
             self.logger.error(f"Error parsing {card_path.name}: {e}")
-            return None, "", ""
+            return None, "", lambda: ""
 
     def fix_quick_info_instruments(self, content: str, instruments: List[str]) -> Tuple[str, bool]:
         """
@@ -96,73 +145,83 @@ class QuickInfoFixer:
 
         Returns: (updated_content, was_changed)
         """
-        # Find the Instruments line in Quick Info section
-        pattern = r'(- \*\*Instruments\*\*:).*'
-
         # Build the replacement
         instruments_str = ', '.join(instruments)
         replacement = rf'\1 {instruments_str}'
 
-        # Check if it needs updating
-        match = re.search(pattern, content)
+        # Check if it needs updating: the common already-correct card is settled with substring
+        # checks on the first Instruments line (the only one compared below), without the regex
+        line_start = content.find(_INSTRUMENTS_LINE_PREFIX)
+        if line_start == -1:
+            return content, False
+        expected_line = f"{_INSTRUMENTS_LINE_PREFIX} {instruments_str}"
+        line_end = line_start + len(expected_line)
+        if content.startswith(expected_line, line_start) and (line_end == len(content) or content[line_end] == '\n'):
+            return content, False
+
+        match = _INSTRUMENTS_LINE_RE.search(content, line_start)
         if not match:
             return content, False
 
         current_line = match.group(0)
-        new_line = re.sub(pattern, replacement, current_line)
+        new_line = _INSTRUMENTS_LINE_RE.sub(replacement, current_line)
 
         # Check if different
         if current_line == new_line:
             return content, False
 
         # Replace the line
-        updated_content = re.sub(pattern, replacement, content)
+        updated_content = _INSTRUMENTS_LINE_RE.sub(replacement, content)
         return updated_content, True
 
-    def process_card(self, card_path: Path) -> str:
-        """Process a single artist card."""
+    def process_card(self, card_path: Path) -> Tuple[str, Dict[str, int]]:
+        """
+        Process a single artist card.
+
+        Runs in a worker process, so it doesn't touch self.stats; run() applies the returned delta.
+
+        Returns: (status, stats_delta)
+        """
         try:
             # Parse card
-            frontmatter, frontmatter_text, body_content = self.parse_card(card_path)
-            if not frontmatter:
-                self.stats['errors'] += 1
-                return "❌ Parse error"
+            frontmatter, frontmatter_text, read_body = self.parse_card(card_path, probe=_INSTRUMENTS_KEY)
+            if frontmatter is None:
+                return "❌ Parse error", {'errors': 1}
 
             # Check if card has instruments in frontmatter
             instruments = frontmatter.get('instruments')
             if not instruments or not isinstance(instruments, list):
-                self.stats['cards_skipped'] += 1
-                return "⏭️  No instruments"
+                return "⏭️  No instruments", {'cards_skipped': 1}
 
-            self.stats['cards_with_instruments'] += 1
+            stats_delta = {'cards_with_instruments': 1}
 
             # Fix Quick Info section
-            updated_body, was_changed = self.fix_quick_info_instruments(body_content, instruments)
+            updated_body, was_changed = self.fix_quick_info_instruments(read_body(), instruments)
 
             if not was_changed:
-                return "✓ Already correct"
+                return "✓ Already correct", stats_delta
 
             if self.dry_run:
                 self.logger.info(f"  [DRY RUN] Would update Quick Info in: {card_path.name}")
-                return "🔍 Would fix Quick Info"
+                return "🔍 Would fix Quick Info", stats_delta
 
-            # Rebuild the file
-            frontmatter_yaml = yaml.dump(frontmatter, default_flow_style=False, allow_unicode=True, sort_keys=False)
-            updated_content = f"---\n{frontmatter_yaml}---{updated_body}"
+            # Rebuild the file around the untouched frontmatter text: only the Instruments line
+            # changed, so re-dumping the YAML would just risk reformatting unrelated keys
+            updated_content = f"---{frontmatter_text}---{updated_body}"
 
-            # Write updated card
-            with open(card_path, 'w', encoding='utf-8') as f:
-                f.write(updated_content)
+            # Write updated card atomically: an interrupted run leaves the old card, never half of one
+            tmp_path = card_path.with_name(f"{card_path.name}.tmp")
+            tmp_path.write_bytes(updated_content.encode('utf-8'))
+            os.replace(tmp_path, card_path)
 
-            self.stats['cards_fixed'] += 1
+            stats_delta['cards_fixed'] = 1
             self.logger.info(f"  ✅ Fixed Quick Info: {card_path.name}")
 
-            return "✅ Quick Info fixed"
+            return "✅ Quick Info fixed", stats_delta
 
         except Exception as e:
             self.logger.error(f"Error processing {card_path.name}: {e}")
-            self.stats['errors'] += 1
-            return f"❌ Error: {str(e)[:30]}"
+            return f"❌ Error: {str(e)[:30]}", {'errors': 1}
 
     def run(self):
         """Run the Quick Info fix process."""
@@ -178,11 +237,17 @@ class QuickInfoFixer:
 
         from tqdm import tqdm
 
-        with tqdm(cards, desc="Fixing Quick Info", unit="card") as pbar:
-            for card_path in pbar:
+        # Worker processes read/parse/write cards in parallel; results come back in card order
+        # and are applied here, so stats need no locking
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                 initargs=(str(self.cards_dir), self.dry_run)) as executor, \
+                tqdm(total=len(cards), desc="Fixing Quick Info", unit="card") as pbar:
+            for card_path, (status, stats_delta) in zip(cards, executor.map(_process_card_in_worker, cards, chunksize=WORKER_CHUNKSIZE)):
                 pbar.set_description(f"Processing: {card_path.stem[:30]}")
-                status = self.process_card(card_path)
+                for key, amount in stats_delta.items():
+                    self.stats[key] += amount
                 pbar.set_postfix_str(status)
+                pbar.update(1)
 
         # Print summary
         self.print_summary()
@@ -197,6 +262,20 @@ class QuickInfoFixer:
         print(f"📁 Total cards processed: {self.stats['total_cards']}")
 
 
+_worker: Optional[QuickInfoFixer] = None  # per-process instance used by the pool workers
+
+
+def _init_worker(cards_dir: str, dry_run: bool):
+    """Pool initializer: build this process's own QuickInfoFixer."""
+    global _worker
+    _worker = QuickInfoFixer(cards_dir, dry_run=dry_run)
+
+
+def _process_card_in_worker(card_path: Path):
+    """Pool task: process one card with this process's instance."""
+    return _worker.process_card(card_path)
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -213,13 +292,20 @@ def main():
         action='store_true',
         help='Preview changes without modifying files'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f'Number of worker processes (default: {DEFAULT_WORKERS})'
+    )
 
     args = parser.parse_args()
 
     try:
         fixer = QuickInfoFixer(
             cards_dir=args.cards_dir,
-            dry_run=args.dry_run
+            dry_run=args.dry_run,
+            workers=args.workers
         )
 
         fixer.run()